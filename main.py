@@ -8,6 +8,7 @@ import os
 import re
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable
 
@@ -18,17 +19,35 @@ _DEFAULT_CONFIG = Path(__file__).resolve().parent / "config.yaml"
 
 from src.config import (
     EUROPE_LOCATION_TRIGGERS,
-    OUTPUT_CHOICES,
+    OUTPUT_CHOICES_TEXT,
     collect_preferences,
     load_preferences_from_yaml,
 )
 from src.data_source import fetch_jobs
 from src.normalize import normalize_response
 from src.extract import extract_all
-from src.summary import print_summaries, export_json, export_csv, export_html
-from src.filtering import filter_jobs
-
-
+from src.summary import export_all, print_summaries
+from src.filtering import filter_jobs, pre_filter_by_language
+
+# Patterns used by _slug to build filesystem-safe filename segments.
+_NON_WORD_RE = re.compile(r"[^\w]")
+_UNDERSCORE_RUN_RE = re.compile(r"_+")
+
+# Output mode → bitmask; each *_LAUNCH mode also sets its base export bit.
+_WANT_JSON, _LAUNCH_JSON = 1, 2
+_WANT_CSV, _LAUNCH_CSV = 4, 8
+_WANT_HTML, _LAUNCH_HTML = 16, 32
+_OUTPUT_BITS: dict[str, int] = {
+    "JSON": _WANT_JSON,
+    "JSON_LAUNCH": _WANT_JSON | _LAUNCH_JSON,
+    "CSV": _WANT_CSV,
+    "CSV_LAUNCH": _WANT_CSV | _LAUNCH_CSV,
+    "HTML": _WANT_HTML,
+    "HTML_LAUNCH": _WANT_HTML | _LAUNCH_HTML,
+}
+
+
+@lru_cache(maxsize=256)
 def _slug(s: str) -> str:
     """Sanitise a string for use as a filename segment.
 
@@ -38,8 +57,8 @@ def _slug(s: str) -> str:
     leading/trailing underscores.
     """
     s = s.strip().lower() or "any"
-    s = re.sub(r"[^\w]", "_", s)
-    s = re.sub(r"_+", "_", s)
+    s = _NON_WORD_RE.sub("_", s)
+    s = _UNDERSCORE_RUN_RE.sub("_", s)
     return s.strip("_") or "any"
 
 
@@ -48,9 +67,10 @@ def _open_in_system(path: Path) -> None:
     Open a file with the OS-associated application (CSV/JSON launch).
 
     Best-effort only: failures are printed as warnings and do not abort the run.
+    Already-absolute paths are used as-is without resolving them again.
     """
     try:
-        resolved = path.resolve()
+        resolved = path if path.is_absolute() else path.resolve()
         if sys.platform.startswith("win"):
             os.startfile(str(resolved))  # type: ignore[attr-defined]
         elif sys.platform == "darwin":
@@ -122,11 +142,10 @@ def main() -> None:
         raise SystemExit(1)
 
     if not prefs.output:
-        allowed = ", ".join(sorted(OUTPUT_CHOICES))
         print(
             "Error: output configuration is empty. Please set at least one value in the "
             "'output' field of your YAML config (allowed values: "
-            f"{allowed})."
+            f"{OUTPUT_CHOICES_TEXT})."
         )
         raise SystemExit(1)
 
@@ -135,6 +154,9 @@ def main() -> None:
 
     raw, timestamp, used_cache, api_called = fetch_jobs(prefs)
     jobs = normalize_response(raw)
+    # The normalized jobs hold everything needed downstream; release the raw
+    # response so it is not kept alive alongside the extracted results.
+    del raw
     total_before = len(jobs)
 
     if not jobs:
@@ -144,7 +166,11 @@ def main() -> None:
     else:
         print(f"Found {total_before} job(s) before filtering. Extracting key info...")
         print()
-        extracted = extract_all(jobs)
+        # Language detection is cheap next to full extraction, so jobs in other
+        # languages are dropped before extract_all rather than after it; the
+        # detected languages are passed on so each job is detected only once.
+        kept, languages = pre_filter_by_language(jobs, prefs.language_filter)
+        extracted = extract_all(kept, languages)
         filtered = filter_jobs(extracted, prefs)
 
     total_after = len(filtered)
@@ -171,38 +197,44 @@ def main() -> None:
     if filtered:
         results_dir = Path("results")
         results_dir.mkdir(parents=True, exist_ok=True)
+        # Resolve once; the export and launch paths below are built from it.
+        results_base = results_dir.resolve()
         location_slug = "europe" if prefs.europe_countries else _slug(prefs.location or "any")
         prefix = f"{_slug(prefs.role)}-{location_slug}-{_slug(prefs.date_posted)}-{timestamp}"
 
-        outputs = {mode.upper() for mode in prefs.output}
-        want_json = "JSON" in outputs or "JSON_LAUNCH" in outputs
-        want_csv = "CSV" in outputs or "CSV_LAUNCH" in outputs
-        want_html = "HTML" in outputs or "HTML_LAUNCH" in outputs
+        mask = 0
+        for mode in prefs.output:
+            mask |= _OUTPUT_BITS.get(mode.upper(), 0)
+        want_json = mask & _WANT_JSON
+        want_csv = mask & _WANT_CSV
+        want_html = mask & _WANT_HTML
 
-        launch_json = "JSON_LAUNCH" in outputs
-        launch_csv = "CSV_LAUNCH" in outputs
-        launch_html = "HTML_LAUNCH" in outputs
+        launch_json = mask & _LAUNCH_JSON
+        launch_csv = mask & _LAUNCH_CSV
+        launch_html = mask & _LAUNCH_HTML
 
         generated_exts: list[str] = []
 
-        json_path = results_dir / f"{prefix}_jobs.json"
-        csv_path = results_dir / f"{prefix}_jobs.csv"
-        html_path = results_dir / f"{prefix}_jobs.html"
+        json_path = results_base / f"{prefix}_jobs.json"
+        csv_path = results_base / f"{prefix}_jobs.csv"
+        html_path = results_base / f"{prefix}_jobs.html"
 
         if want_json:
-            export_json(filtered, json_path, prefs=prefs)
             generated_exts.append("json")
         if want_csv:
-            export_csv(filtered, csv_path)
             generated_exts.append("csv")
         if want_html:
-            export_html(
-                filtered,
-                html_path,
-                prefs=prefs,
-                timestamp=timestamp,
-            )
             generated_exts.append("html")
+        export_all(
+            filtered,
+            prefs=prefs,
+            timestamp=timestamp,
+            json_path=json_path if want_json else None,
+            csv_path=csv_path if want_csv else None,
+            html_path=html_path if want_html else None,
+            # Indent the JSON only when it is opened for a person to read.
+            json_compact=not launch_json,
+        )
 
         if launch_json and json_path.exists():
             _open_in_system(json_path)
@@ -213,7 +245,7 @@ def main() -> None:
             try:
                 import webbrowser
 
-                webbrowser.open(html_path.resolve().as_uri(), new=2)
+                webbrowser.open(html_path.as_uri(), new=2)
             except Exception as exc:  # pragma: no cover - defensive
                 print(f"Warning: could not open HTML results in browser: {exc}")
 
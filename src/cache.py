@@ -3,13 +3,22 @@
 from __future__ import annotations
 
 import json
+import os
+import time
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Mapping, Optional
+
+try:  # optional: much faster (de)serialisation of large API bodies
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
 
 CACHE_DIR = Path("debug/cache")
 CACHE_TTL = timedelta(hours=24)
+_CACHE_TTL_SECS = CACHE_TTL.total_seconds()
 
 
 @dataclass
@@ -17,8 +26,12 @@ class CacheEntry:
     role: str
     location: str
     date_posted: str
-    timestamp: str  # ISO8601 string in UTC
+    timestamp: float  # seconds since the Unix epoch (UTC)
     raw_response: dict[str, Any]
+    # HTTP validators from the response that produced raw_response; used to
+    # issue a conditional GET once the entry is older than CACHE_TTL.
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
 
 
 def _ensure_cache_dir() -> Path:
@@ -26,63 +39,123 @@ def _ensure_cache_dir() -> Path:
     return CACHE_DIR
 
 
+def _read_entry(path: Path) -> dict[str, Any]:
+    """Read and parse a cache file; raises OSError or ValueError on failure."""
+    content = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _write_entry(path: Path, data: dict[str, Any]) -> None:
+    """
+    Serialise data to path atomically.
+
+    The payload is written to a sibling temporary file first and then renamed
+    over the target, so an interrupted run never leaves a truncated entry.
+    Entries are written compact (no indentation): they hold whole API
+    responses and are only ever read back by this module.
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data)
+    else:
+        payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
+
+
+@lru_cache(maxsize=512)
+def _slug(s: str) -> str:
+    """Sanitise a key component for use in a cache filename (memoised)."""
+    s = s.strip().lower() or "any"
+    return "".join(c if c.isalnum() or c in ("-", "_") else "_" for c in s)[:80]
+
+
+def _entry_epoch(value: Any) -> Optional[float]:
+    """
+    Return a cache entry timestamp as epoch seconds, or None if unparseable.
+
+    Entries written by older versions store an ISO8601 string instead.
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        ts = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.timestamp()
+
+
 def _key_to_path(
     role: str,
     location: str,
     date_posted: str,
     europe_countries: list[str] | None = None,
 ) -> Path:
-    def slug(s: str) -> str:
-        s = s.strip().lower() or "any"
-        return "".join(c if c.isalnum() or c in ("-", "_") else "_" for c in s)[:80]
-
-    role_slug = slug(role)
+    role_slug = _slug(role)
     if europe_countries:
         # Encode sorted country list into the location slug so that changing
         # the country list automatically busts the cache.
         codes = "_".join(sorted(c.lower() for c in europe_countries))
-        loc_slug = slug(location or "europe") + "__" + codes
+        loc_slug = _slug(location or "europe") + "__" + codes
     else:
-        loc_slug = slug(location or "any")
-    dp_slug = slug(date_posted or "today")
+        loc_slug = _slug(location or "any")
+    dp_slug = _slug(date_posted or "today")
     return _ensure_cache_dir() / f"{role_slug}__{loc_slug}__{dp_slug}.json"
 
 
-def load_cache(
+def load_cache_with_validators(
     role: str,
     location: str,
     date_posted: str,
     europe_countries: list[str] | None = None,
-) -> Optional[dict[str, Any]]:
+) -> tuple[Optional[dict[str, Any]], Optional[str], Optional[str], bool]:
     """
-    Return cached raw_response if present and not older than CACHE_TTL.
-    Otherwise return None.
+    Return (raw_response, etag, last_modified, stale) for the cache entry.
+
+    Unlike load_cache, the body is returned even when the entry is older than
+    CACHE_TTL (with stale=True) so callers can revalidate it with a conditional
+    request instead of downloading it again. Returns (None, None, None, True)
+    when there is no usable entry.
     """
+    missing: tuple[None, None, None, bool] = (None, None, None, True)
     path = _key_to_path(role, location, date_posted, europe_countries)
     if not path.exists():
-        return None
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    except (OSError, json.JSONDecodeError):
-        return None
-
-    ts_str = data.get("timestamp")
-    if not ts_str:
-        return None
+        return missing
     try:
-        ts = datetime.fromisoformat(ts_str)
-    except ValueError:
-        return None
-
-    now = datetime.now(timezone.utc)
-    if ts.tzinfo is None:
-        ts = ts.replace(tzinfo=timezone.utc)
-    if now - ts > CACHE_TTL:
-        return None
+        data = _read_entry(path)
+    except (OSError, ValueError):
+        return missing
 
     raw = data.get("raw_response")
     if not isinstance(raw, dict):
+        return missing
+
+    ts = _entry_epoch(data.get("timestamp"))
+    stale = ts is None or time.time() - ts > _CACHE_TTL_SECS
+
+    return raw, data.get("etag"), data.get("last_modified"), stale
+
+
+def load_cache(
+    role: str,
+    location: str,
+    date_posted: str,
+    europe_countries: list[str] | None = None,
+) -> Optional[dict[str, Any]]:
+    """
+    Return cached raw_response if present and not older than CACHE_TTL.
+    Otherwise return None.
+    """
+    raw, _etag, _last_modified, stale = load_cache_with_validators(
+        role, location, date_posted, europe_countries
+    )
+    if stale:
         return None
     return raw
 
@@ -93,16 +166,43 @@ def save_cache(
     date_posted: str,
     raw_response: dict[str, Any],
     europe_countries: list[str] | None = None,
+    headers: Mapping[str, str] | None = None,
 ) -> None:
-    """Save raw_response to cache with current UTC timestamp."""
+    """
+    Save raw_response to cache with the current time.
+
+    When the HTTP response headers are given, their ETag / Last-Modified
+    validators are stored alongside the body for later revalidation.
+    """
     entry = CacheEntry(
         role=role,
         location=location,
         date_posted=date_posted,
-        timestamp=datetime.now(timezone.utc).isoformat(),
+        timestamp=time.time(),
         raw_response=raw_response,
+        etag=headers.get("ETag") if headers else None,
+        last_modified=headers.get("Last-Modified") if headers else None,
     )
     path = _key_to_path(role, location, date_posted, europe_countries)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(asdict(entry), f, indent=2, ensure_ascii=False)
+    _write_entry(path, asdict(entry))
+
 
+def touch_cache(
+    role: str,
+    location: str,
+    date_posted: str,
+    europe_countries: list[str] | None = None,
+) -> None:
+    """
+    Refresh the timestamp of an existing cache entry, keeping its body.
+
+    Used after a conditional request answered with HTTP 304 Not Modified.
+    Missing or unreadable entries are left untouched.
+    """
+    path = _key_to_path(role, location, date_posted, europe_countries)
+    try:
+        data = _read_entry(path)
+    except (OSError, ValueError):
+        return
+    data["timestamp"] = time.time()
+    _write_entry(path, data)
@@ -1,41 +1,50 @@
 """User preferences for job search and post-fetch filtering."""
 
+import copy
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, List, Mapping, Optional
+from typing import Any, List, Mapping, Optional, Sequence
 
 import yaml
 
+# libyaml-backed parser when PyYAML was built with it, pure-Python otherwise.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 DEFAULT_ROLE = "Android Developer"
 DEFAULT_LOCATION = ""
 DEFAULT_DATE_POSTED = "today"
 
-LOCATION_TYPE_CHOICES = {"on-site", "hybrid", "remote"}
-POSITION_TYPE_CHOICES = {"permanent", "contract", "freelance"}
-DATE_POSTED_CHOICES = {"today", "week", "month", "all"}
+LOCATION_TYPE_CHOICES: frozenset[str] = frozenset({"on-site", "hybrid", "remote"})
+POSITION_TYPE_CHOICES: frozenset[str] = frozenset({"permanent", "contract", "freelance"})
+DATE_POSTED_CHOICES: frozenset[str] = frozenset({"today", "week", "month", "all"})
 
 # Output configuration: which result formats to generate and whether to auto-launch them.
 # Values are case-insensitive in YAML and normalised to these uppercase forms.
-OUTPUT_CHOICES: set[str] = {
-    "CSV",
-    "JSON",
-    "HTML",
-    "CSV_LAUNCH",
-    "JSON_LAUNCH",
-    "HTML_LAUNCH",
-}
+OUTPUT_CHOICES: frozenset[str] = frozenset(
+    {
+        "CSV",
+        "JSON",
+        "HTML",
+        "CSV_LAUNCH",
+        "JSON_LAUNCH",
+        "HTML_LAUNCH",
+    }
+)
+# Sorted, comma-separated OUTPUT_CHOICES for error messages.
+OUTPUT_CHOICES_TEXT: str = ", ".join(sorted(OUTPUT_CHOICES))
 
 # Location strings that trigger multi-country European search mode.
 EUROPE_LOCATION_TRIGGERS: frozenset[str] = frozenset(
     {"europe", "eu", "european economic area"}
 )
 # Default European country codes used when none are explicitly provided.
-DEFAULT_EUROPE_COUNTRIES: list[str] = ["gb", "es", "pt"]
+DEFAULT_EUROPE_COUNTRIES: tuple[str, ...] = ("gb", "es", "pt")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SearchPreferences:
-    """User-provided search criteria and filters."""
+    """User-provided search criteria and filters (immutable once built)."""
 
     role: str
     location: str
@@ -66,22 +75,21 @@ class SearchPreferences:
     europe_countries: List[str] = field(default_factory=list)
 
 
-def _parse_multi_choice(raw: str, valid: set[str]) -> list[str]:
+def _parse_multi_choice(raw: str, valid: frozenset[str]) -> list[str]:
     """
     Parse a comma-separated list of choices, keeping only valid entries.
     Returns an empty list when the user leaves it blank or nothing valid is provided.
     """
     if not raw.strip():
         return []
-    parts = [p.strip().lower() for p in raw.split(",")]
-    selected = []
-    for p in parts:
-        if p in valid and p not in selected:
-            selected.append(p)
-    return selected
+    # Lowercase and drop all whitespace in one pass over the whole input; every
+    # valid choice is a single token, so no per-part strip() is needed.
+    parts = "".join(raw.lower().split()).split(",")
+    # dict.fromkeys deduplicates while keeping first-seen order.
+    return list(dict.fromkeys(p for p in parts if p in valid))
 
 
-def _normalize_choice_list(value: Any, valid_choices: set[str]) -> list[str]:
+def _normalize_choice_list(value: Any, valid_choices: frozenset[str]) -> list[str]:
     """
     Normalize a YAML-provided value into a list of valid lowercase strings.
     Accepts a single string or a sequence of strings; ignores invalid entries.
@@ -95,16 +103,31 @@ def _normalize_choice_list(value: Any, valid_choices: set[str]) -> list[str]:
             candidates = list(value)
         except TypeError:
             return []
+    seen: set[str] = set()
     normalized: list[str] = []
     for item in candidates:
         if not isinstance(item, str):
             continue
         s = item.strip().lower()
-        if s and s in valid_choices and s not in normalized:
+        if s in valid_choices and s not in seen:
+            seen.add(s)
             normalized.append(s)
     return normalized
 
 
+def _choose(raw: Any, choices: Optional[frozenset[str]], default: str) -> str:
+    """
+    Normalise a single value (stripped, lowercased) and validate it.
+
+    Returns *default* when the value is missing, blank, or not in *choices*;
+    when *choices* is None any non-blank value is accepted.
+    """
+    s = str(raw).strip().lower() if raw is not None else ""
+    if not s or (choices is not None and s not in choices):
+        return default
+    return s
+
+
 def _coerce_minimum_salary(value: Any) -> Optional[int]:
     """Coerce YAML value into an integer minimum salary, or None."""
     if value is None:
@@ -160,6 +183,12 @@ def _normalize_output_list(value: Any) -> list[str]:
     return normalized
 
 
+def _prompt(message: str, hint: str = "") -> str:
+    """Ask for input, showing *hint* as " [hint]" when non-empty; returns the stripped answer."""
+    suffix = f" [{hint}]" if hint else ""
+    return input(f"{message}{suffix}: ").strip()
+
+
 def collect_preferences(defaults: Optional["SearchPreferences"] = None) -> "SearchPreferences":
     """
     Prompt user for role/location (used for the API call and caching)
@@ -177,67 +206,66 @@ def collect_preferences(defaults: Optional["SearchPreferences"] = None) -> "Sear
     default_minimum_salary: Optional[int] = defaults.minimum_salary if defaults is not None else None
     default_industry_filter: Optional[str] = defaults.industry_filter if defaults is not None else None
     default_language_filter: str = (defaults.language_filter if defaults and defaults.language_filter else None) or "en"
-    default_europe_countries: list[str] = (
-        list(defaults.europe_countries) if defaults is not None else list(DEFAULT_EUROPE_COUNTRIES)
+    default_europe_countries: Sequence[str] = (
+        defaults.europe_countries if defaults is not None else DEFAULT_EUROPE_COUNTRIES
     )
     default_output: list[str] = list(defaults.output) if defaults is not None else []
     # Keywords are configured via YAML only; there is no interactive prompt.
     default_keywords: list[str] = list(defaults.keywords) if defaults is not None else []
 
+    # Prompt hints, built once up front.
+    default_codes_str = ",".join(default_europe_countries) or "none"
+    default_loc_types_str = ",".join(default_location_types)
+    default_pos_types_str = ",".join(default_position_types)
+    salary_hint = str(default_minimum_salary) if default_minimum_salary is not None else ""
+
     # Core search parameters
-    role_input = input(f"Role [{default_role}]: ").strip() or default_role
-    location_input = input(
+    role_input = _prompt("Role", default_role) or default_role
+    location_input = _prompt(
         "Location (Barcelona, London, or leave empty for any location, "
-        f"'europe' will trigger a multi-country European search) [{default_location}]: "
-    ).strip()
-    if not location_input:
-        location_input = default_location
+        "'europe' will trigger a multi-country European search)",
+        default_location,
+    ) or default_location
 
     # Multi-country Europe mode
     europe_countries: list[str] = []
     if location_input.lower() in EUROPE_LOCATION_TRIGGERS:
-        default_codes = ",".join(default_europe_countries)
-        codes_hint = f" [{default_codes}]" if default_codes else " [none]"
-        raw_countries = input(
-            f"European country codes to search (comma-separated ISO codes){codes_hint}: "
-        ).strip()
+        raw_countries = _prompt(
+            "European country codes to search (comma-separated ISO codes)", default_codes_str
+        )
         if raw_countries:
             europe_countries = [c.strip().lower() for c in raw_countries.split(",") if c.strip()]
         else:
             europe_countries = list(default_europe_countries)
 
-    date_posted_raw = input(
-        f"Posting date filter [today/week/month/all] (default {default_date_posted}): "
-    ).strip().lower()
-    date_posted = date_posted_raw if date_posted_raw in DATE_POSTED_CHOICES else default_date_posted
+    date_posted = _choose(
+        _prompt(f"Posting date filter [today/week/month/all] (default {default_date_posted})"),
+        DATE_POSTED_CHOICES,
+        default_date_posted,
+    )
 
     # Filters
-    default_loc_types_str = ",".join(default_location_types) if default_location_types else ""
-    loc_types_hint = f" [{default_loc_types_str}]" if default_loc_types_str else ""
-    loc_types_raw = input(
-        f"Location types filter (comma-separated: on-site, hybrid, remote; "
-        f"leave empty for no filtering){loc_types_hint}: "
+    loc_types_raw = _prompt(
+        "Location types filter (comma-separated: on-site, hybrid, remote; "
+        "leave empty for no filtering)",
+        default_loc_types_str,
     )
-    if loc_types_raw.strip():
+    if loc_types_raw:
         location_types = _parse_multi_choice(loc_types_raw, LOCATION_TYPE_CHOICES)
     else:
         location_types = list(default_location_types)
 
-    default_pos_types_str = ",".join(default_position_types) if default_position_types else ""
-    pos_types_hint = f" [{default_pos_types_str}]" if default_pos_types_str else ""
-    pos_types_raw = input(
-        f"Position types filter (comma-separated: permanent, contract, freelance; "
-        f"leave empty for no filtering){pos_types_hint}: "
+    pos_types_raw = _prompt(
+        "Position types filter (comma-separated: permanent, contract, freelance; "
+        "leave empty for no filtering)",
+        default_pos_types_str,
     )
-    if pos_types_raw.strip():
+    if pos_types_raw:
         position_types = _parse_multi_choice(pos_types_raw, POSITION_TYPE_CHOICES)
     else:
         position_types = list(default_position_types)
 
-    salary_hint = f" [{default_minimum_salary}]" if default_minimum_salary is not None else ""
-    min_salary_raw = input(
-        f"Minimum salary filter (number, leave empty for no minimum){salary_hint}: "
-    ).strip()
+    min_salary_raw = _prompt("Minimum salary filter (number, leave empty for no minimum)", salary_hint)
     minimum_salary: Optional[int]
     if min_salary_raw:
         try:
@@ -247,22 +275,17 @@ def collect_preferences(defaults: Optional["SearchPreferences"] = None) -> "Sear
     else:
         minimum_salary = default_minimum_salary
 
-    industry_hint = f" [{default_industry_filter}]" if default_industry_filter else ""
-    industry_raw = input(
-        f"Industry filter (free text, leave empty for no filtering){industry_hint}: "
-    ).strip()
+    industry_raw = _prompt(
+        "Industry filter (free text, leave empty for no filtering)", default_industry_filter or ""
+    )
     industry_filter = industry_raw if industry_raw else default_industry_filter
 
-    lang_raw = input(
-        f"Job spec language filter [en/any] (default {default_language_filter}): "
-    ).strip().lower()
-    if not lang_raw:
-        language_filter = default_language_filter
-    elif lang_raw in {"en", "any"}:
-        language_filter = lang_raw
-    else:
-        # Allow arbitrary language codes but default to lowercased value
-        language_filter = lang_raw
+    # Arbitrary language codes are accepted as-is (lowercased).
+    language_filter = _choose(
+        _prompt(f"Job spec language filter [en/any] (default {default_language_filter})"),
+        None,
+        default_language_filter,
+    )
 
     return SearchPreferences(
         role=role_input,
@@ -294,12 +317,26 @@ def load_preferences_from_yaml(path: str | Path) -> SearchPreferences:
         language_filter: "en"
 
     Missing keys fall back to the same defaults as interactive input.
+
+    Parsed files are cached by (resolved path, mtime, size), so editing the
+    file invalidates the cache; callers always receive their own copy.
     """
+    file_path = path if isinstance(path, Path) else Path(path)
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {file_path}") from None
+    prefs = _load_preferences_cached(str(file_path.resolve()), st.st_mtime_ns, st.st_size)
+    return copy.deepcopy(prefs)
+
+
+@lru_cache(maxsize=8)
+def _load_preferences_cached(path: str, mtime_ns: int, size: int) -> SearchPreferences:
+    """Parse a YAML config; mtime_ns and size are only part of the cache key."""
     file_path = Path(path)
-    if not file_path.exists():
-        raise FileNotFoundError(f"Config file not found: {file_path}")
-    with file_path.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+    # Binary mode lets libyaml detect and decode the encoding itself.
+    with file_path.open("rb") as f:
+        data = yaml.load(f, Loader=_SafeLoader) or {}
 
     if not isinstance(data, Mapping):
         raise ValueError("YAML config must define a mapping at the top level.")
@@ -307,12 +344,7 @@ def load_preferences_from_yaml(path: str | Path) -> SearchPreferences:
     role = str(data.get("role") or DEFAULT_ROLE)
     location = str(data.get("location") or DEFAULT_LOCATION)
 
-    date_posted_raw = data.get("date_posted")
-    if date_posted_raw is None or not str(date_posted_raw).strip():
-        date_posted = DEFAULT_DATE_POSTED
-    else:
-        candidate = str(date_posted_raw).strip().lower()
-        date_posted = candidate if candidate in DATE_POSTED_CHOICES else DEFAULT_DATE_POSTED
+    date_posted = _choose(data.get("date_posted"), DATE_POSTED_CHOICES, DEFAULT_DATE_POSTED)
 
     location_types = _normalize_choice_list(
         data.get("location_types"), LOCATION_TYPE_CHOICES
@@ -330,11 +362,7 @@ def load_preferences_from_yaml(path: str | Path) -> SearchPreferences:
         s = str(industry_raw).strip()
         industry_filter = s or None
 
-    lang_raw = data.get("language_filter")
-    if lang_raw is None or not str(lang_raw).strip():
-        language_filter = "en"
-    else:
-        language_filter = str(lang_raw).strip().lower()
+    language_filter = _choose(data.get("language_filter"), None, "en")
 
     # Keyword-based filter: normalise to a list of non-empty strings. Accept a
     # single string or a sequence of strings. Case normalisation is left to the
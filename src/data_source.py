@@ -2,17 +2,27 @@
 
 import ast
 import json
+import mmap
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Mapping
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # optional: faster JSON parsing, straight from bytes/buffers
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
 
 from src.config import SearchPreferences, EUROPE_LOCATION_TRIGGERS
-from src.cache import load_cache, save_cache
+from src.cache import load_cache_with_validators, save_cache, touch_cache
 
 load_dotenv()
 
@@ -20,10 +30,47 @@ JSEARCH_URL = "https://jsearch.p.rapidapi.com/search"
 MOCK_PATH = Path("debug/mock/JSearchMockResponse.json")
 DEBUG_DIR = Path("debug/api-response")
 MAX_PAGES = 5  # Number of result pages to request per API call (10 results/page)
+MAX_PARALLEL_COUNTRIES = 16  # Concurrent per-country API calls in multi-country mode
+
+# One pooled session for all JSearch calls, so keep-alive connections (and
+# their TLS handshakes) are reused across requests and concurrent countries.
+# Transient failures (rate limiting, gateway errors) are retried with backoff,
+# honouring any Retry-After header.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    raise_on_status=False,
+)
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=MAX_PARALLEL_COUNTRIES, max_retries=_RETRY),
+)
+
+# Trailing comma before a closing ] or } (not valid JSON / literal syntax).
+_TRAILING_COMMA_RE = re.compile(r",(\s*[\]}])")
+# Tokens that differ between a Python literal and JSON: single-quoted strings
+# and None/True/False. Double-quoted strings are matched (and kept as-is) so
+# that words inside them are never rewritten.
+_PY_LITERAL_TOKEN_RE = re.compile(
+    r'"[^"\\]*(?:\\.[^"\\]*)*"'
+    r"|'([^'\\]*(?:\\.[^'\\]*)*)'"
+    r"|\b(None|True|False)\b"
+)
+_PY_TO_JSON_CONSTANTS = {"None": "null", "True": "true", "False": "false"}
+
+
+_debug_dir_ready = False
 
 
 def _ensure_debug_dir() -> Path:
-    DEBUG_DIR.mkdir(parents=True, exist_ok=True)
+    """Create DEBUG_DIR on first use; later calls skip the mkdir syscall."""
+    global _debug_dir_ready
+    if not _debug_dir_ready:
+        DEBUG_DIR.mkdir(parents=True, exist_ok=True)
+        _debug_dir_ready = True
     return DEBUG_DIR
 
 
@@ -33,81 +80,146 @@ def get_timestamp() -> str:
 
 
 def _save_raw_response(raw: str | dict, path: Path, timestamp: str) -> None:
-    _ensure_debug_dir()
+    """
+    Write raw to path (an existing directory, see _ensure_debug_dir).
+
+    Dicts are written as compact JSON; set DEBUG_PRETTY=1 (e.g. in .env) to
+    indent them for reading, or pretty-print afterwards with
+    `python -m json.tool <file>`.
+    """
     filepath = path / f"{timestamp}_response.json"
+    pretty = os.environ.get("DEBUG_PRETTY", "").strip().lower() in ("1", "true", "yes", "on")
+    if isinstance(raw, dict) and orjson is not None:
+        # Serialised to bytes in C and written with a single call.
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        filepath.write_bytes(orjson.dumps(raw, option=option))
+        return None
     with open(filepath, "w", encoding="utf-8") as f:
         if isinstance(raw, dict):
-            json.dump(raw, f, indent=2, ensure_ascii=False)
+            if pretty:
+                json.dump(raw, f, indent=2, ensure_ascii=False)
+            else:
+                json.dump(raw, f, ensure_ascii=False, separators=(",", ":"))
         else:
             f.write(raw)
     return None
 
 
-def _parse_mock_content(content: str) -> Any:
-    """Parse Python-style or JSON mock file (single quotes, None, trailing commas)."""
+def _looks_like_python_literal(content: str) -> bool:
+    """True when the first string delimiter is a single quote (Python repr style)."""
+    head = content[:64]
+    single = head.find("'")
+    double = head.find('"')
+    return single != -1 and (double == -1 or single < double)
+
+
+def _py_literal_token_to_json(match: re.Match[str]) -> str:
+    """Replacement callback for _PY_LITERAL_TOKEN_RE."""
+    single_quoted, constant = match.group(1), match.group(2)
+    if constant is not None:
+        return _PY_TO_JSON_CONSTANTS[constant]
+    if single_quoted is not None:
+        return '"' + single_quoted.replace("\\'", "'").replace('"', '\\"') + '"'
+    return match.group(0)
+
+
+def _parse_mock_content(content: str, try_json: bool = True) -> Any:
+    """
+    Parse Python-style or JSON mock file (single quotes, None, trailing commas).
+
+    try_json=False skips the plain JSON attempt, for callers that already know
+    the content is not valid JSON.
+    """
     content = content.strip()
-    # Try JSON first (double quotes, no trailing commas)
+    # Try JSON first (double quotes, no trailing commas), unless the content is
+    # evidently a Python literal and the JSON attempt is bound to fail.
+    if try_json and not _looks_like_python_literal(content):
+        try:
+            return orjson.loads(content) if orjson is not None else json.loads(content)
+        except ValueError:  # json / orjson JSONDecodeError
+            pass
+    # Preprocess for ast.literal_eval: remove trailing commas before ] or }
+    content = _TRAILING_COMMA_RE.sub(r"\1", content)
+    # Transcode the Python literal to JSON in one regex pass and parse that;
+    # ast.literal_eval is much slower and only kept for inputs the transcoder
+    # cannot handle (e.g. \x escapes, tuples).
+    transcoded = _PY_LITERAL_TOKEN_RE.sub(_py_literal_token_to_json, content)
     try:
-        return json.loads(content)
-    except json.JSONDecodeError:
+        return orjson.loads(transcoded) if orjson is not None else json.loads(transcoded)
+    except ValueError:  # json / orjson JSONDecodeError
         pass
-    # Preprocess for ast.literal_eval: remove trailing commas before ] or }
-    content = re.sub(r",\s*]", "]", content)
-    content = re.sub(r",\s*}", "}", content)
     try:
         return ast.literal_eval(content)
     except (ValueError, SyntaxError) as e:
         raise ValueError(f"Could not parse mock file as JSON or Python literal: {e}") from e
 
 
+# Explicit country names / abbreviations
+_COUNTRY_KEYWORDS: dict[str, list[str]] = {
+    "gb": ["uk", "united kingdom", "england", "scotland", "wales", "britain", "great britain"],
+    "us": ["usa", "united states", "united states of america", "america", "u.s.", "u.s.a."],
+    "ca": ["canada"],
+    "de": ["germany", "deutschland"],
+    "fr": ["france"],
+    "es": ["spain", "españa"],
+    "it": ["italy", "italia"],
+    "au": ["australia"],
+    "in": ["india"],
+}
+
+# Common city → country hints (non-exhaustive; can be extended)
+_CITY_HINTS: dict[str, str] = {
+    "london": "gb",
+    "paris": "fr",
+    "berlin": "de",
+    "madrid": "es",
+    "barcelona": "es",
+    "rome": "it",
+    "sydney": "au",
+    "melbourne": "au",
+    "toronto": "ca",
+    "vancouver": "ca",
+    "new york": "us",
+    "san francisco": "us",
+    "los angeles": "us",
+}
+
+
+def _compile_terms(terms: Iterable[str]) -> re.Pattern[str]:
+    """Match any of the lowercase terms as whole words (longest first) in lowercased text."""
+    alternation = "|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True))
+    return re.compile(rf"(?<!\w)({alternation})(?!\w)")
+
+
+_COUNTRY_TERM_MAP: dict[str, str] = {
+    kw: code for code, keywords in _COUNTRY_KEYWORDS.items() for kw in keywords
+}
+_COUNTRY_TERM_RE = _compile_terms(_COUNTRY_TERM_MAP)
+_CITY_TERM_RE = _compile_terms(_CITY_HINTS)
+
+
+@lru_cache(maxsize=512)
 def _infer_country(location: str) -> str | None:
     """
     Best-effort mapping from a free-form location string to a country code.
     This is heuristic and intentionally small; it can be extended over time.
+
+    Country names take precedence over city hints, and when several country
+    names appear the one earliest in the string wins (so "Paris, France, UK"
+    maps to "fr"). Terms only match as whole words, so e.g. "Ukraine" is not
+    mistaken for "uk".
     """
     if not location:
         return None
+    # Lowercase the text rather than matching case-insensitively: re.I accepts
+    # characters (e.g. "İ", "ſ") whose lowercase form is not one of the keys.
     loc = location.lower()
-
-    # Explicit country names / abbreviations
-    country_keywords: dict[str, list[str]] = {
-        "gb": ["uk", "united kingdom", "england", "scotland", "wales", "britain", "great britain"],
-        "us": ["usa", "united states", "united states of america", "america", "u.s.", "u.s.a."],
-        "ca": ["canada"],
-        "de": ["germany", "deutschland"],
-        "fr": ["france"],
-        "es": ["spain", "españa"],
-        "it": ["italy", "italia"],
-        "au": ["australia"],
-        "in": ["india"],
-    }
-
-    # Common city → country hints (non-exhaustive; can be extended)
-    city_hints: dict[str, str] = {
-        "london": "gb",
-        "paris": "fr",
-        "berlin": "de",
-        "madrid": "es",
-        "barcelona": "es",
-        "rome": "it",
-        "sydney": "au",
-        "melbourne": "au",
-        "toronto": "ca",
-        "vancouver": "ca",
-        "new york": "us",
-        "san francisco": "us",
-        "los angeles": "us",
-    }
-
-    for code, keywords in country_keywords.items():
-        for kw in keywords:
-            if kw in loc:
-                return code
-
-    for city, code in city_hints.items():
-        if city in loc:
-            return code
-
+    m = _COUNTRY_TERM_RE.search(loc)
+    if m:
+        return _COUNTRY_TERM_MAP[m.group(1)]
+    m = _CITY_TERM_RE.search(loc)
+    if m:
+        return _CITY_HINTS[m.group(1)]
     return None
 
 
@@ -117,8 +229,17 @@ def _fetch_jsearch_single(
     location: str,
     date_posted: str,
     country: str | None = None,
-) -> dict:
-    """Call JSearch API for a single role/location combination."""
+    etag: str | None = None,
+    last_modified: str | None = None,
+) -> tuple[dict | None, Mapping[str, str]]:
+    """
+    Call JSearch API for a single role/location combination.
+
+    When etag / last_modified validators from a previous response are given,
+    the request is made conditional (If-None-Match / If-Modified-Since).
+    Returns (response body, response headers); the body is None when the
+    server answered 304 Not Modified.
+    """
     if location and location.lower() not in EUROPE_LOCATION_TRIGGERS:
         query = f"{role} in {location}"
     else:
@@ -139,51 +260,86 @@ def _fetch_jsearch_single(
         "X-RapidAPI-Key": api_key,
         "X-RapidAPI-Host": "jsearch.p.rapidapi.com",
     }
-    resp = requests.get(JSEARCH_URL, params=params, headers=headers, timeout=30)
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    resp = _SESSION.get(JSEARCH_URL, params=params, headers=headers, timeout=30)
+    if resp.status_code == 304:
+        return None, resp.headers
     resp.raise_for_status()
-    return resp.json()
+    if orjson is not None:
+        return orjson.loads(resp.content), resp.headers
+    return resp.json(), resp.headers
+
+
+def _fetch_jsearch_country(api_key: str, prefs: SearchPreferences, country_code: str) -> dict | None:
+    """Fetch one country's results for multi-country mode; None when the call fails."""
+    print(f"  Fetching jobs for country: {country_code.upper()}...")
+    try:
+        result, _headers = _fetch_jsearch_single(
+            api_key,
+            role=prefs.role,
+            location=country_code,
+            date_posted=prefs.date_posted,
+            country=country_code,
+        )
+    except Exception as exc:  # noqa: BLE001
+        print(f"  Warning: API call for country '{country_code}' failed: {exc}")
+        return None
+    return result
 
 
 def _fetch_jsearch_multi_country(api_key: str, prefs: SearchPreferences) -> dict:
     """
     Call JSearch API once per country in prefs.europe_countries, then merge
     and deduplicate results by job_id into a single synthetic response dict.
-    """
-    seen_ids: set[str] = set()
-    merged_jobs: list[dict] = []
 
-    for country_code in prefs.europe_countries:
-        print(f"  Fetching jobs for country: {country_code.upper()}...")
-        try:
-            result = _fetch_jsearch_single(
-                api_key,
-                role=prefs.role,
-                location=country_code,
-                date_posted=prefs.date_posted,
-                country=country_code,
-            )
-        except Exception as exc:  # noqa: BLE001
-            print(f"  Warning: API call for country '{country_code}' failed: {exc}")
+    The per-country calls are independent and network-bound, so they run
+    concurrently (up to MAX_PARALLEL_COUNTRIES at a time); results are merged
+    in the order of prefs.europe_countries regardless of completion order.
+    """
+    countries = prefs.europe_countries
+    workers = max(1, min(MAX_PARALLEL_COUNTRIES, len(countries)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            executor.map(lambda code: _fetch_jsearch_country(api_key, prefs, code), countries)
+        )
+
+    # Keyed by job_id: the first occurrence wins and dict order keeps the
+    # country order.
+    merged: dict[str, dict] = {}
+    for result in results:
+        if result is None:
             continue
-
         for job in result.get("data") or []:
-            job_id = job.get("job_id") or job.get("job_title", "")
-            if job_id not in seen_ids:
-                seen_ids.add(job_id)
-                merged_jobs.append(job)
+            merged.setdefault(job.get("job_id") or job.get("job_title", ""), job)
+
+    return {"status": "OK", "data": list(merged.values())}
 
-    return {"status": "OK", "data": merged_jobs}
 
+def _fetch_jsearch(
+    api_key: str,
+    prefs: SearchPreferences,
+    etag: str | None = None,
+    last_modified: str | None = None,
+) -> tuple[dict | None, Mapping[str, str] | None]:
+    """
+    Dispatch to single or multi-country JSearch API call based on prefs.
 
-def _fetch_jsearch(api_key: str, prefs: SearchPreferences) -> dict:
-    """Dispatch to single or multi-country JSearch API call based on prefs."""
+    Returns (raw response, response headers). Validators only apply to
+    single-location calls: the merged multi-country response has no single
+    upstream ETag, so it is always fetched in full and returned without headers.
+    """
     if prefs.europe_countries:
-        return _fetch_jsearch_multi_country(api_key, prefs)
+        return _fetch_jsearch_multi_country(api_key, prefs), None
     return _fetch_jsearch_single(
         api_key,
         role=prefs.role,
         location=prefs.location,
         date_posted=prefs.date_posted,
+        etag=etag,
+        last_modified=last_modified,
     )
 
 
@@ -195,29 +351,49 @@ def _load_mock() -> dict:
     case the inner raw_response dict is returned so downstream code always
     receives the same shape.
     """
-    path = Path(MOCK_PATH)
-    if not path.exists():
-        raise FileNotFoundError(f"Mock file not found: {path}")
-    with open(path, "r", encoding="utf-8") as f:
-        content = f.read()
-    parsed = _parse_mock_content(content)
+    parsed: Any = None
+    json_failed = False
+    try:
+        f = open(MOCK_PATH, "rb")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Mock file not found: {MOCK_PATH}") from None
+    with f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file: nothing to map
+            content = ""
+        else:
+            with mm:
+                # JSON mocks are parsed straight from the page cache; only the
+                # Python-literal form is decoded (directly from the mapping,
+                # without an intermediate bytes copy).
+                head = mm[:64].decode("utf-8", errors="ignore")
+                if orjson is not None and not _looks_like_python_literal(head):
+                    try:
+                        parsed = orjson.loads(memoryview(mm))
+                    except orjson.JSONDecodeError:
+                        # Not valid JSON (e.g. trailing commas): don't let
+                        # _parse_mock_content try the same parse again.
+                        json_failed = True
+                content = "" if parsed is not None else str(mm, "utf-8")
+    if parsed is None:
+        parsed = _parse_mock_content(content, try_json=not json_failed)
     if isinstance(parsed, dict) and "raw_response" in parsed:
         return parsed["raw_response"]
     return parsed
 
 
-def _job_matches_location(job: dict, location_query: str) -> bool:
-    """True if job's location fields match the user's location string (case-insensitive)."""
-    if not location_query or not location_query.strip():
-        return True
-    q = location_query.strip().lower()
-    fields = (
-        job.get("job_location") or "",
-        job.get("job_city") or "",
-        job.get("job_state") or "",
-        job.get("job_country") or "",
-    )
-    return any(q in (str(f).lower()) for f in fields if f)
+_LOCATION_FIELDS = ("job_location", "job_city", "job_state", "job_country")
+
+
+def _location_blob(job: dict) -> str:
+    """
+    The job's non-empty location fields, lowercased and joined by NUL.
+
+    The separator cannot occur in a location query, so a single substring
+    test on the blob matches exactly when one of the fields matches.
+    """
+    return "\0".join(filter(None, map(job.get, _LOCATION_FIELDS))).lower()
 
 
 def _filter_by_location(raw: dict, prefs: SearchPreferences) -> dict:
@@ -226,6 +402,9 @@ def _filter_by_location(raw: dict, prefs: SearchPreferences) -> dict:
     For multi-country Europe searches, keeps only jobs whose job_country
     is in prefs.europe_countries. For normal searches, falls back to a
     substring match on location fields.
+
+    raw is modified in place (its "data" list is replaced) and returned; the
+    caller passes a freshly loaded mock it owns.
     """
     data = raw.get("data")
     if not isinstance(data, list):
@@ -237,13 +416,16 @@ def _filter_by_location(raw: dict, prefs: SearchPreferences) -> dict:
             j for j in data
             if isinstance(j, dict) and (j.get("job_country") or "").lower() in allowed
         ]
-        return {**raw, "data": filtered}
+        raw["data"] = filtered
+        return raw
 
     location = prefs.location
     if not location or not location.strip():
         return raw
-    filtered = [j for j in data if isinstance(j, dict) and _job_matches_location(j, location)]
-    return {**raw, "data": filtered}
+    q = location.strip().lower()
+    filtered = [j for j in data if isinstance(j, dict) and q in _location_blob(j)]
+    raw["data"] = filtered
+    return raw
 
 
 def fetch_jobs(prefs: SearchPreferences) -> tuple[dict, str, bool, bool]:
@@ -261,15 +443,26 @@ def fetch_jobs(prefs: SearchPreferences) -> tuple[dict, str, bool, bool]:
     api_called = False
 
     # Try cache first (role + location + date_posted + europe_countries);
-    # filters are applied later.
-    cached = load_cache(prefs.role, prefs.location, prefs.date_posted, prefs.europe_countries or None)
-    if cached is not None:
+    # filters are applied later. Expired entries are still returned together
+    # with their HTTP validators so the API call can be a conditional GET.
+    cache_key = (prefs.role, prefs.location, prefs.date_posted, prefs.europe_countries or None)
+    cached, etag, last_modified, stale = load_cache_with_validators(*cache_key)
+    if cached is not None and not stale:
         raw = cached
         used_cache = True
     else:
+        headers: Mapping[str, str] | None = None
         if api_key:
-            raw = _fetch_jsearch(api_key, prefs)
+            if cached is None:
+                etag = last_modified = None
+            fetched, headers = _fetch_jsearch(api_key, prefs, etag, last_modified)
             api_called = True
+            if fetched is None:
+                # 304 Not Modified: the expired cache body is still current.
+                raw = cached
+                used_cache = True
+            else:
+                raw = fetched
         else:
             try:
                 raw = _load_mock()
@@ -284,7 +477,17 @@ def fetch_jobs(prefs: SearchPreferences) -> tuple[dict, str, bool, bool]:
                 print(f"Warning: Could not parse mock file: {e}")
                 raise SystemExit(1) from e
 
-        save_cache(prefs.role, prefs.location, prefs.date_posted, raw, prefs.europe_countries or None)
+        if used_cache:
+            touch_cache(*cache_key)
+        else:
+            save_cache(
+                prefs.role,
+                prefs.location,
+                prefs.date_posted,
+                raw,
+                prefs.europe_countries or None,
+                headers=headers,
+            )
 
     _save_raw_response(raw, _ensure_debug_dir(), timestamp)
     return raw, timestamp, used_cache, api_called
@@ -1,9 +1,16 @@
 """Extract key job fields from normalized job dicts."""
 
 import re
+from functools import lru_cache
+from itertools import islice
 from typing import Any
 
-from langdetect import detect, LangDetectException
+from langdetect import DetectorFactory, detect, LangDetectException
+
+# langdetect is probabilistic; a fixed seed makes results reproducible. One
+# detection at import loads the language profiles up front.
+DetectorFactory.seed = 0
+detect("warm up the language profiles")
 
 # Keywords to infer location type from description
 REMOTE_PATTERNS = [
@@ -45,6 +52,31 @@ PERMANENT_PATTERNS = [
     r"FULLTIME",
 ]
 
+# Lines of a description that mention any of these are taken as requirements
+REQUIREMENT_PATTERNS = [r"required", r"qualifications", r"requirements", r"must have", r"experience"]
+
+
+def _compile_any(patterns: list[str]) -> re.Pattern[str]:
+    """Compile a pattern list into one case-insensitive alternation."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.I)
+
+
+REMOTE_RE = _compile_any(REMOTE_PATTERNS)
+HYBRID_RE = _compile_any(HYBRID_PATTERNS)
+ONSITE_RE = _compile_any(ONSITE_PATTERNS)
+CONTRACT_RE = _compile_any(CONTRACT_PATTERNS)
+FREELANCE_RE = _compile_any(FREELANCE_PATTERNS)
+PERMANENT_RE = _compile_any(PERMANENT_PATTERNS)
+REQUIREMENT_RE = _compile_any(REQUIREMENT_PATTERNS)
+
+# Common English function words; an ASCII job ad opening with several of them
+# is treated as English without running the (slow) statistical detector.
+_EN_STOPWORD_RE = re.compile(
+    r"\b(the|and|with|you|your|our|for|are|will|this|have|of|to|is)\b", re.I
+)
+_EN_FAST_PATH_PREFIX = 512
+_EN_FAST_PATH_MIN_WORDS = 6
+
 # Tech keywords (curated list for Android/software roles)
 TECH_KEYWORDS = [
     "Kotlin", "Java", "Android", "Android SDK", "Android Studio", "Gradle",
@@ -54,47 +86,36 @@ TECH_KEYWORDS = [
     "Azure", "AWS", "GCP", "Firebase", "NDK", "Python", "C++", "Swift",
     "Objective-C", "React", "Node", "TypeScript", "JavaScript", "RESTful",
 ]
+# (keyword, lowercased keyword) pairs, lowercased once at import.
+_TECH_KEYWORDS_LOWER = tuple((tech, tech.lower()) for tech in TECH_KEYWORDS)
 
 
-def _location_type(job: dict[str, Any]) -> str:
+def _location_type(job: dict[str, Any], title_lower: str, desc_lower: str) -> str:
     """Infer on-site / hybrid / remote / not defined."""
-    desc = (job.get("job_description") or "").lower()
-    title = (job.get("job_title") or "").lower()
-    combined = f"{title} {desc}"
-    is_remote_flag = job.get("job_is_remote") is True
-
-    if is_remote_flag:
+    if job.get("job_is_remote") is True:
+        return "remote"
+    if REMOTE_RE.search(title_lower) or REMOTE_RE.search(desc_lower):
         return "remote"
-    for p in REMOTE_PATTERNS:
-        if re.search(p, combined, re.I):
-            return "remote"
-    for p in HYBRID_PATTERNS:
-        if re.search(p, combined, re.I):
-            return "hybrid"
-    for p in ONSITE_PATTERNS:
-        if re.search(p, combined, re.I):
-            return "on-site"
-    if job.get("job_location") and not is_remote_flag:
+    if HYBRID_RE.search(title_lower) or HYBRID_RE.search(desc_lower):
+        return "hybrid"
+    if ONSITE_RE.search(title_lower) or ONSITE_RE.search(desc_lower):
+        return "on-site"
+    if job.get("job_location"):
         return "on-site"  # has location and not remote => assume on-site
     return "not defined"
 
 
-def _position_type(job: dict[str, Any]) -> str:
+def _position_type(job: dict[str, Any], title_lower: str, desc_lower: str) -> str:
     """Infer permanent / contract / freelance / not defined."""
     emp_type = (job.get("job_employment_type") or "").lower()
     types_list = [t.upper() for t in (job.get("job_employment_types") or [])]
-    desc = (job.get("job_description") or "").lower()
-    title = (job.get("job_title") or "").lower()
-    combined = f"{title} {desc} {emp_type} {' '.join(types_list)}"
+    combined = f"{title_lower} {desc_lower} {emp_type} {' '.join(types_list)}"
 
-    if "CONTRACTOR" in types_list or any(re.search(p, combined, re.I) for p in CONTRACT_PATTERNS):
+    if "CONTRACTOR" in types_list or CONTRACT_RE.search(combined):
         return "contract"
-    for p in FREELANCE_PATTERNS:
-        if re.search(p, combined, re.I):
-            return "freelance"
-    if "FULLTIME" in types_list or "PARTTIME" in types_list or any(
-        re.search(p, combined, re.I) for p in PERMANENT_PATTERNS
-    ):
+    if FREELANCE_RE.search(combined):
+        return "freelance"
+    if "FULLTIME" in types_list or "PARTTIME" in types_list or PERMANENT_RE.search(combined):
         return "permanent"
     return "not defined"
 
@@ -104,11 +125,10 @@ def _min_salary(job: dict[str, Any]) -> int | None:
     return job.get("job_min_salary")
 
 
-def _industry(job: dict[str, Any]) -> str | None:
+def _industry(job: dict[str, Any], desc_lower: str) -> str | None:
     """Industry if inferable from employer/description (simple heuristic)."""
     emp = (job.get("employer_name") or "").lower()
-    desc = (job.get("job_description") or "").lower()[:2000]
-    text = f"{emp} {desc}"
+    text = f"{emp} {desc_lower[:2000]}"
     if any(x in text for x in ("fintech", "finance", "bank", "payment", "insurance")):
         return "Finance / Insurance"
     if any(x in text for x in ("retail", "ecommerce", "e-commerce")):
@@ -120,45 +140,51 @@ def _industry(job: dict[str, Any]) -> str | None:
     return None
 
 
-def _job_spec_language(job: dict[str, Any]) -> str:
+def _job_spec_language(desc: str) -> str:
     """Primary language of the job ad (not required candidate language)."""
-    desc = job.get("job_description") or ""
     if not desc.strip():
         return "not defined"
+    return _detect_language(desc[:5000])
+
+
+def job_language(job: dict[str, Any]) -> str:
+    """job_spec_language of one normalized job dict, without the other fields."""
+    return _job_spec_language(job.get("job_description") or "")
+
+
+@lru_cache(maxsize=2048)
+def _detect_language(text: str) -> str:
+    """Detect the language of text; memoised since ads are often reposted verbatim."""
+    prefix = text[:_EN_FAST_PATH_PREFIX]
+    if prefix.isascii():
+        distinct = {w.lower() for w in _EN_STOPWORD_RE.findall(prefix)}
+        if len(distinct) >= _EN_FAST_PATH_MIN_WORDS:
+            return "en"
     try:
-        return detect(desc[:5000])
+        return detect(text)
     except LangDetectException:
         return "not defined"
 
 
-def _tech_stack(job: dict[str, Any]) -> list[str]:
+def _tech_stack(desc_lower: str, highlights: dict[str, Any]) -> list[str]:
     """Extract mentioned technologies from description and highlights."""
-    desc = job.get("job_description") or ""
-    highlights = job.get("job_highlights") or {}
     quals = " ".join(highlights.get("Qualifications", []))
     resp = " ".join(highlights.get("Responsibilities", []))
-    combined = f"{desc} {quals} {resp}"
-    found = []
-    for tech in TECH_KEYWORDS:
-        if tech.lower() in combined.lower():
-            found.append(tech)
+    combined = f"{desc_lower} {quals.lower()} {resp.lower()}"
+    found = [tech for tech, lowered in _TECH_KEYWORDS_LOWER if lowered in combined]
     return list(dict.fromkeys(found))  # preserve order, no dupes
 
 
-def _requirements(job: dict[str, Any]) -> list[str]:
+def _requirements(desc: str, highlights: dict[str, Any]) -> list[str]:
     """Key requirements from job highlights or description."""
-    highlights = job.get("job_highlights") or {}
     quals = list(highlights.get("Qualifications", []))
     if quals:
         return quals[:15]
-    desc = job.get("job_description") or ""
-    lines = [l.strip() for l in desc.split("\n") if l.strip() and len(l.strip()) > 20]
-    requirement_keywords = ["required", "qualifications", "requirements", "must have", "experience"]
+    # First 50 non-trivial lines of the description.
+    lines = islice((l for l in map(str.strip, desc.split("\n")) if len(l) > 20), 50)
     out = []
-    for line in lines[:50]:
-        if any(k in line.lower() for k in requirement_keywords) or (
-            line.endswith(".") and 30 < len(line) < 300
-        ):
+    for line in lines:
+        if REQUIREMENT_RE.search(line) or (line.endswith(".") and 30 < len(line) < 300):
             out.append(line)
             if len(out) >= 15:
                 break
@@ -170,26 +196,43 @@ def _job_link(job: dict[str, Any]) -> str | None:
     return job.get("job_apply_link")
 
 
-def extract_job_info(job: dict[str, Any]) -> dict[str, Any]:
-    """Extract all required key fields from one normalized job dict."""
+def extract_job_info(job: dict[str, Any], language: str | None = None) -> dict[str, Any]:
+    """
+    Extract all required key fields from one normalized job dict.
+
+    language, when given, is the job's already detected job_spec_language
+    (see job_language) and is used instead of detecting it again.
+    """
+    # Shared inputs of the helpers below, looked up and lowercased only once.
+    desc = job.get("job_description") or ""
+    desc_lower = desc.lower()
+    title_lower = (job.get("job_title") or "").lower()
+    highlights = job.get("job_highlights") or {}
     return {
         "role": job.get("job_title"),
         "employer_name": job.get("employer_name"),
         "location": job.get("job_location"),
         "job_country": job.get("job_country"),
-        "location_type": _location_type(job),
-        "position_type": _position_type(job),
+        "location_type": _location_type(job, title_lower, desc_lower),
+        "position_type": _position_type(job, title_lower, desc_lower),
         "minimum_salary": _min_salary(job),
-        "industry": _industry(job),
-        "job_spec_language": _job_spec_language(job),
-        "tech_stack": _tech_stack(job),
-        "requirements": _requirements(job),
+        "industry": _industry(job, desc_lower),
+        "job_spec_language": language if language is not None else _job_spec_language(desc),
+        "tech_stack": _tech_stack(desc_lower, highlights),
+        "requirements": _requirements(desc, highlights),
         "job_link": _job_link(job),
         # keep raw for summary
         "_raw": job,
     }
 
 
-def extract_all(jobs: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    """Extract key info for each job."""
-    return [extract_job_info(j) for j in jobs]
+def extract_all(jobs: list[dict[str, Any]], languages: list[str] | None = None) -> list[dict[str, Any]]:
+    """
+    Extract key info for each job.
+
+    languages, when given, holds each job's already detected language in the
+    same order as jobs (as returned by filtering.pre_filter_by_language).
+    """
+    if languages is None:
+        return [extract_job_info(j) for j in jobs]
+    return [extract_job_info(j, lang) for j, lang in zip(jobs, languages, strict=True)]
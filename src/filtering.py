@@ -1,126 +1,132 @@
 """Filtering layer for extracted job data based on user preferences."""
 
-from typing import Any
+import re
+from typing import Any, Optional
 
 from src.config import SearchPreferences
+from src.extract import job_language
+
+_WORD_RE = re.compile(r"\w+")
+_KEYWORD_FIELDS = ("requirements", "tech_stack", "summary", "title", "company")
 
 
 def filter_jobs(extracted_jobs: list[dict[str, Any]], prefs: SearchPreferences) -> list[dict[str, Any]]:
     """
     Apply post-fetch filters to the extracted jobs according to user preferences.
     If a given filter is effectively \"empty\", it is not applied.
+
+    Everything derived from prefs is computed once up front; each filter below
+    is then a cheap check per job, and a filter set to None is skipped.
     """
+    # Location / position type: if none selected, accept all.
+    location_types = {t.lower() for t in prefs.location_types} if prefs.location_types else None
+    position_types = {t.lower() for t in prefs.position_types} if prefs.position_types else None
+
+    # Minimum salary: if set, accept only jobs with a defined minimum_salary >=
+    # the given minimum. A minimum that is not a number matches nothing.
+    minimum_salary: Optional[int] = None
+    if prefs.minimum_salary is not None:
+        try:
+            minimum_salary = int(prefs.minimum_salary)
+        except (TypeError, ValueError):
+            return []
+
+    # Industry: empty / not defined means no filter.
+    industry = prefs.industry_filter.lower() if prefs.industry_filter else None
+
+    language = _language_code(prefs.language_filter)
+
+    keywords = _normalise_keywords(getattr(prefs, "keywords", None))
+
     filtered = []
     for job in extracted_jobs:
-        if not _passes_location_type(job, prefs):
+        if location_types is not None and (job.get("location_type") or "").lower() not in location_types:
             continue
-        if not _passes_position_type(job, prefs):
+        if position_types is not None and (job.get("position_type") or "").lower() not in position_types:
             continue
-        if not _passes_minimum_salary(job, prefs):
+        if minimum_salary is not None and not _salary_at_least(job.get("minimum_salary"), minimum_salary):
             continue
-        if not _passes_industry(job, prefs):
+        if industry is not None and industry not in (job.get("industry") or "").lower():
             continue
-        if not _passes_language(job, prefs):
+        if language is not None and not (job.get("job_spec_language") or "").lower().startswith(language):
             continue
-        if not _passes_keywords(job, prefs):
+        if keywords is not None and not _matches_keywords(job, keywords):
             continue
         filtered.append(job)
     return filtered
 
 
-def _passes_location_type(job: dict[str, Any], prefs: SearchPreferences) -> bool:
-    """Location type filter: if none selected, accept all."""
-    if not prefs.location_types:
-        return True
-    loc_type = (job.get("location_type") or "").lower()
-    return loc_type in {t.lower() for t in prefs.location_types}
-
-
-def _passes_position_type(job: dict[str, Any], prefs: SearchPreferences) -> bool:
-    """Position type filter: if none selected, accept all."""
-    if not prefs.position_types:
-        return True
-    pos_type = (job.get("position_type") or "").lower()
-    return pos_type in {t.lower() for t in prefs.position_types}
-
-
-def _passes_minimum_salary(job: dict[str, Any], prefs: SearchPreferences) -> bool:
+def pre_filter_by_language(
+    jobs: list[dict[str, Any]], lang_pref: Optional[str]
+) -> tuple[list[dict[str, Any]], Optional[list[str]]]:
+    """
+    Drop normalized jobs whose ad is not in the preferred language, before
+    extraction.
+
+    Uses the same rule as the language filter in filter_jobs, so running both
+    keeps the final result unchanged while sparing extract_all the jobs that
+    would be filtered out anyway. Returns the kept jobs and their detected
+    languages, in the same order, so extract_all can reuse them instead of
+    detecting again; when lang_pref is \"any\" nothing is detected and
+    (jobs, None) is returned.
+    """
+    language = _language_code(lang_pref)
+    if language is None:
+        return jobs, None
+    kept: list[dict[str, Any]] = []
+    languages: list[str] = []
+    for job in jobs:
+        job_lang = job_language(job)
+        if job_lang.lower().startswith(language):
+            kept.append(job)
+            languages.append(job_lang)
+    return kept, languages
+
+
+def _language_code(lang_pref: Optional[str]) -> Optional[str]:
     """
-    Minimum salary filter:
-    - If no minimum is set, accept all.
-    - If set, accept only jobs with a defined minimum_salary >= given minimum.
+    Job spec language filter: missing means the default \"en\" (English
+    only), \"any\" accepts all (None), otherwise the lowercased code that
+    job_spec_language must start with.
     """
-    if prefs.minimum_salary is None:
-        return True
-    job_min = job.get("minimum_salary")
+    language = (lang_pref or "").lower() or "en"
+    return None if language == "any" else language
+
+
+def _salary_at_least(job_min: Any, minimum: int) -> bool:
+    """True when the job's minimum salary is defined and at least `minimum`."""
     if job_min is None:
         return False
     try:
-        return int(job_min) >= int(prefs.minimum_salary)
+        return int(job_min) >= minimum
     except (TypeError, ValueError):
         return False
 
 
-def _passes_industry(job: dict[str, Any], prefs: SearchPreferences) -> bool:
-    """Industry filter: empty / not defined means no filter."""
-    if not prefs.industry_filter:
-        return True
-    industry = (job.get("industry") or "").lower()
-    if not industry:
-        return False
-    return prefs.industry_filter.lower() in industry
-
-
-def _passes_language(job: dict[str, Any], prefs: SearchPreferences) -> bool:
+def _normalise_keywords(raw_keywords: Any) -> Optional[frozenset[str]]:
     """
-    Job spec language filter:
-    - Default is \"en\" (English only)
-    - If set to \"any\", accept all.
-    - Otherwise, check that job_spec_language starts with the provided code (case-insensitive).
+    Normalise the configured keywords: strip whitespace, lowercase, and drop
+    empties and non-strings. Returns None when nothing is left, which disables
+    the keyword filter.
     """
-    lang_pref = (prefs.language_filter or "").lower()
-    if not lang_pref:
-        # Treat missing as default English-only
-        lang_pref = "en"
-    if lang_pref == "any":
-        return True
-    job_lang = (job.get("job_spec_language") or "").lower()
-    if not job_lang:
-        return False
-    return job_lang.startswith(lang_pref)
+    if not raw_keywords:
+        return None
+    keywords = frozenset(
+        s for s in (kw.strip().lower() for kw in raw_keywords if isinstance(kw, str)) if s
+    )
+    return keywords or None
 
 
-def _passes_keywords(job: dict[str, Any], prefs: SearchPreferences) -> bool:
+def _matches_keywords(job: dict[str, Any], keywords: frozenset[str]) -> bool:
     """
     Keyword-based filter over the job specification text.
 
-    When prefs.keywords is empty, this filter is effectively disabled and all
-    jobs pass. Otherwise, a job is kept only when at least one configured
-    keyword appears as a whole word (case-insensitive) in the combined text of
-    selected fields.
+    A job is kept only when at least one configured keyword appears as a whole
+    word (case-insensitive) in the combined text of selected fields.
     """
-    if not getattr(prefs, "keywords", None):
-        return True
-
-    # Normalise the configured keywords: strip whitespace, lowercase, and drop
-    # empties and duplicates while preserving order.
-    seen: set[str] = set()
-    keywords: list[str] = []
-    for raw_kw in prefs.keywords:
-        if not isinstance(raw_kw, str):
-            continue
-        s = raw_kw.strip().lower()
-        if not s or s in seen:
-            continue
-        seen.add(s)
-        keywords.append(s)
-
-    if not keywords:
-        return True
-
     # Build a searchable blob from relevant text fields.
     parts: list[str] = []
-    for key in ("requirements", "tech_stack", "summary", "title", "company"):
+    for key in _KEYWORD_FIELDS:
         value = job.get(key)
         if isinstance(value, str) and value.strip():
             parts.append(value)
@@ -132,9 +138,4 @@ def _passes_keywords(job: dict[str, Any], prefs: SearchPreferences) -> bool:
         return False
 
     # Whole-word match: split on word characters and check membership.
-    import re
-
-    tokens = re.findall(r"\w+", blob)
-    token_set = set(tokens)
-    return any(kw in token_set for kw in keywords)
-
+    return not keywords.isdisjoint(_WORD_RE.findall(blob))
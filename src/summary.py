@@ -2,62 +2,350 @@
 
 import csv
 import html as _html_module
+import io
 import json
+import os
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Iterable
+from string import Template
+from typing import IO, Any, Callable, Iterable
+
+try:  # optional: much faster JSON export
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+
+# Buffer size for the exporters' output files: large enough that a whole
+# export is flushed in a handful of write calls.
+_WRITE_BUFFER_SIZE = 4 << 20
+
+# Separator line printed above each console summary.
+_SEP = "=" * 60
+
+# Columns of the CSV export, in order.
+_CSV_COLUMNS = (
+    "role", "employer_name", "location", "location_type", "position_type",
+    "minimum_salary", "industry", "job_spec_language", "tech_stack", "requirements", "job_link",
+)
+_CSV_TECH_STACK = _CSV_COLUMNS.index("tech_stack")
+_CSV_REQUIREMENTS = _CSV_COLUMNS.index("requirements")
+
+# Stylesheet of the HTML export, spliced into the page verbatim (it is never
+# scanned for template placeholders).
+_CSS = """    *, *::before, *::after { box-sizing: border-box; margin: 0; padding: 0; }
+    body {
+      font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
+      background: #f4f6f9;
+      color: #222;
+      padding: 2rem 1rem;
+    }
+    header {
+      max-width: 860px;
+      margin: 0 auto 2rem;
+    }
+    header h1 {
+      font-size: 1.7rem;
+      font-weight: 700;
+      color: #1a1a2e;
+      margin-bottom: 1rem;
+    }
+    .criteria {
+      background: #fff;
+      border-radius: 10px;
+      box-shadow: 0 2px 8px rgba(0,0,0,.08);
+      padding: 1rem 1.4rem;
+      margin-bottom: 0.75rem;
+    }
+    .criteria table {
+      border-collapse: collapse;
+      font-size: 0.88rem;
+    }
+    .criteria th {
+      text-align: left;
+      width: 140px;
+      padding: 0.22rem 0.6rem 0.22rem 0;
+      color: #666;
+      font-weight: 600;
+    }
+    .criteria td {
+      color: #222;
+      padding: 0.22rem 0;
+    }
+    .run-meta {
+      font-size: 0.8rem;
+      color: #888;
+      margin-top: 0.5rem;
+    }
+    .cards {
+      max-width: 860px;
+      margin: 0 auto;
+      display: flex;
+      flex-direction: column;
+      gap: 1.25rem;
+    }
+    .card {
+      background: #fff;
+      border-radius: 10px;
+      box-shadow: 0 2px 8px rgba(0,0,0,.08);
+      padding: 1.4rem 1.6rem;
+    }
+    .card-header {
+      display: flex;
+      align-items: flex-start;
+      gap: 1rem;
+      margin-bottom: 1rem;
+    }
+    .job-num {
+      background: #e8edf5;
+      color: #3a5a8c;
+      font-weight: 700;
+      font-size: 0.8rem;
+      padding: 0.25rem 0.55rem;
+      border-radius: 6px;
+      white-space: nowrap;
+      margin-top: 0.2rem;
+    }
+    .job-title {
+      font-size: 1.15rem;
+      font-weight: 700;
+      color: #1a1a2e;
+    }
+    .company {
+      font-size: 0.95rem;
+      color: #555;
+      margin-top: 0.15rem;
+    }
+    table.meta {
+      border-collapse: collapse;
+      width: 100%;
+      font-size: 0.88rem;
+      margin-bottom: 0.9rem;
+    }
+    table.meta th {
+      text-align: left;
+      width: 140px;
+      padding: 0.28rem 0.5rem 0.28rem 0;
+      color: #666;
+      font-weight: 600;
+      vertical-align: top;
+    }
+    table.meta td {
+      padding: 0.28rem 0;
+      color: #333;
+      vertical-align: top;
+    }
+    td.tags { display: flex; flex-wrap: wrap; gap: 0.35rem; }
+    .tag {
+      background: #e8f0fe;
+      color: #2a5aad;
+      font-size: 0.78rem;
+      padding: 0.18rem 0.55rem;
+      border-radius: 20px;
+      font-weight: 500;
+    }
+    .reqs {
+      font-size: 0.88rem;
+      margin-bottom: 1rem;
+    }
+    .reqs strong {
+      display: block;
+      margin-bottom: 0.4rem;
+      color: #444;
+    }
+    .reqs ul {
+      padding-left: 1.2rem;
+      color: #333;
+    }
+    .reqs li { margin-bottom: 0.25rem; line-height: 1.45; }
+    .apply-btn {
+      display: inline-block;
+      background: #2a5aad;
+      color: #fff;
+      text-decoration: none;
+      padding: 0.45rem 1.1rem;
+      border-radius: 7px;
+      font-size: 0.88rem;
+      font-weight: 600;
+      transition: background 0.15s;
+    }
+    .apply-btn:hover { background: #1e4080; }
+    footer {
+      max-width: 860px;
+      margin: 2rem auto 0;
+      font-size: 0.8rem;
+      color: #999;
+      text-align: center;
+    }
+"""
+
+# Page shell of the HTML export, compiled once: everything up to the
+# stylesheet (_PAGE_OPEN), from the stylesheet to the job cards
+# (_PAGE_HEADER) and after the cards (_PAGE_TAIL). Every value substituted
+# into the templates is already escaped HTML.
+_PAGE_OPEN = Template(
+    """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="utf-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
+  <title>Job results — $title</title>
+  <style>
+"""
+)
+_PAGE_HEADER = Template(
+    """  </style>
+</head>
+<body>
+  <header>
+    <h1>Job results: $heading</h1>
+    <div class="criteria">
+      <table>
+        $criteria_rows
+      </table>
+    </div>
+    <div class="run-meta">$run_meta</div>
+  </header>
+  <div class="cards">
+    """
+)
+_PAGE_TAIL = """
+  </div>
+  <footer>Generated by Job Hunter Agent</footer>
+</body>
+</html>
+"""
+
+
+# Export directories already created by this process.
+_MKDIR_CACHE: set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create path's parent directory once per process, however many exports go there."""
+    parent = path.parent
+    if parent in _MKDIR_CACHE:
+        return
+    parent.mkdir(parents=True, exist_ok=True)
+    _MKDIR_CACHE.add(parent)
+
+
+def _open_export(path: Path, mode: str, newline: str | None = None) -> IO[Any]:
+    """
+    Open an export file for writing (mode "w" or "wb") with a large buffer.
+
+    The kernel is also told the file is written sequentially, where
+    posix_fadvise exists (not on Windows or macOS).
+    """
+    if "b" in mode:
+        f = open(path, mode, buffering=_WRITE_BUFFER_SIZE)
+    else:
+        f = open(path, mode, encoding="utf-8", newline=newline, buffering=_WRITE_BUFFER_SIZE)
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass  # only a hint
+    return f
+
+
+@lru_cache(maxsize=4096)
+def _esc(s: str) -> str:
+    """HTML-escape s; memoised because field values repeat heavily across jobs."""
+    return _html_module.escape(s)
+
+
+def _esc_value(value: object) -> str:
+    """HTML-escape any value as text; None becomes an empty string."""
+    if value is None:
+        return ""
+    return _esc(value if isinstance(value, str) else str(value))
+
+
+@lru_cache(maxsize=512)
+def _tech_tags(tech: tuple[str, ...]) -> str:
+    """Tech stack entries as HTML tag <span>s; memoised as stacks repeat across jobs."""
+    return "".join(f'<span class="tag">{_esc_value(t)}</span>' for t in tech)
+
+
+# Optional rows of a job card's meta table, in display order:
+# (extracted field, label, <td> attributes, render). render returns the
+# cell's HTML or None to leave the row out.
+_OPTIONAL_ROWS: tuple[tuple[str, str, str, Callable[[Any], str | None]], ...] = (
+    ("minimum_salary", "Min. salary", "", lambda v: None if v is None else f"{v:,} (annual)"),
+    ("industry", "Industry", "", lambda v: _esc_value(v) if v else None),
+    (
+        "job_spec_language",
+        "Job ad language",
+        "",
+        lambda v: _esc_value(v) if v and v != "not defined" else None,
+    ),
+    ("tech_stack", "Tech stack", ' class="tags"', lambda v: _tech_tags(tuple(v)) if v else None),
+)
+
+
+def _trunc(text: str, limit: int = 200, ellipsis: str = "...") -> str:
+    """text cut to limit characters plus ellipsis; returned as-is when short enough."""
+    return text if len(text) <= limit else text[:limit] + ellipsis
 
 
 def build_summary(extracted: dict[str, Any], index: int) -> str:
     """Build one human-readable summary from extracted job info."""
-    lines = [
-        f"{'='*60}",
-        f"Job #{index + 1}: {extracted.get('role', 'N/A')}",
-        f"Company: {extracted.get('employer_name', 'N/A')}",
-        f"Location: {extracted.get('location') or 'Not specified'}",
-        f"Location type: {extracted.get('location_type', 'not defined')}",
-        f"Position type: {extracted.get('position_type', 'not defined')}",
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    w(
+        f"{_SEP}\n"
+        f"Job #{index + 1}: {extracted.get('role', 'N/A')}\n"
+        f"Company: {extracted.get('employer_name', 'N/A')}\n"
+        f"Location: {extracted.get('location') or 'Not specified'}\n"
+        f"Location type: {extracted.get('location_type', 'not defined')}\n"
+        f"Position type: {extracted.get('position_type', 'not defined')}\n"
+    )
     min_sal = extracted.get("minimum_salary")
     if min_sal is not None:
-        lines.append(f"Minimum salary: {min_sal:,} (annual)")
+        w(f"Minimum salary: {min_sal:,} (annual)\n")
     industry = extracted.get("industry")
     if industry:
-        lines.append(f"Industry: {industry}")
+        w(f"Industry: {industry}\n")
     lang = extracted.get("job_spec_language")
     if lang and lang != "not defined":
-        lines.append(f"Job ad language: {lang}")
-    tech = extracted.get("tech_stack") or []
+        w(f"Job ad language: {lang}\n")
+    tech = extracted.get("tech_stack")
     if tech:
-        lines.append(f"Tech stack: {', '.join(tech)}")
-    reqs = extracted.get("requirements") or []
+        w(f"Tech stack: {', '.join(tech)}\n")
+    reqs = extracted.get("requirements")
     if reqs:
-        lines.append("Key requirements:")
+        w("Key requirements:\n")
         for r in reqs[:8]:
-            lines.append(f"  - {r[:200]}{'...' if len(r) > 200 else ''}")
+            w(f"  - {_trunc(r)}\n")
     link = extracted.get("job_link")
     if link:
-        lines.append(f"Apply: {link}")
-    lines.append("")
-    return "\n".join(lines)
+        w(f"Apply: {link}\n")
+    return buf.getvalue()
 
 
 def print_summaries(extracted_list: list[dict[str, Any]]) -> None:
-    """Print tailored summaries to console."""
-    for i, ex in enumerate(extracted_list):
-        print(build_summary(ex, i))
+    """Print tailored summaries to console (as one write, not one per job)."""
+    sys.stdout.write("".join(f"{build_summary(ex, i)}\n" for i, ex in enumerate(extracted_list)))
 
 
 def export_json(
     extracted_list: list[dict[str, Any]],
     path: Path,
     prefs: Any | None = None,
+    *,
+    compact: bool = True,
 ) -> None:
     """
     Export extracted job list to JSON (without _raw if present for brevity).
 
     When prefs.keywords is configured, each job includes a `matched_keywords`
     field listing which (normalised) keywords were found in its spec text.
+    The file is written without whitespace for machine consumers unless
+    compact=False, which indents it for reading.
     """
 
     def _normalised_keywords(prefs_obj: Any) -> list[str]:
@@ -103,36 +391,47 @@ def export_json(
 
     norm_keywords = _normalised_keywords(prefs)
 
-    out: list[dict[str, Any]] = []
-    for ex in extracted_list:
-        d = {k: v for k, v in ex.items() if k != "_raw"}
-        if norm_keywords:
+    out = [{k: v for k, v in ex.items() if k != "_raw"} for ex in extracted_list]
+    if norm_keywords:
+        for d in out:
             d["matched_keywords"] = _matched_keywords(d, norm_keywords)
-        out.append(d)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(out, f, indent=2, ensure_ascii=False)
+    _ensure_dir(path)
+    if orjson is not None:
+        # Serialised to UTF-8 bytes in C and written with a single call.
+        with _open_export(path, "wb") as f:
+            option = orjson.OPT_NON_STR_KEYS | (0 if compact else orjson.OPT_INDENT_2)
+            f.write(orjson.dumps(out, option=option))
+        return
+    with _open_export(path, "w") as f:
+        if compact:
+            json.dump(out, f, ensure_ascii=False, separators=(",", ":"))
+        else:
+            json.dump(out, f, indent=2, ensure_ascii=False)
+
+
+def _csv_row(ex: dict[str, Any]) -> list[Any]:
+    """One CSV row in _CSV_COLUMNS order; tech stack and requirements joined."""
+    # map(ex.get, ...) fetches every column in one C-level pass and, unlike
+    # itemgetter, tolerates jobs missing a key.
+    row = list(map(ex.get, _CSV_COLUMNS))
+    tech = row[_CSV_TECH_STACK]
+    if isinstance(tech, list):
+        row[_CSV_TECH_STACK] = "; ".join(tech)
+    reqs = row[_CSV_REQUIREMENTS]
+    if isinstance(reqs, list):
+        row[_CSV_REQUIREMENTS] = "; ".join(str(x)[:100] for x in reqs)
+    return row
 
 
 def export_csv(extracted_list: list[dict[str, Any]], path: Path) -> None:
     """Export flattened job list to CSV (one row per job; requirements/tech as joined string)."""
     if not extracted_list:
         return
-    path.parent.mkdir(parents=True, exist_ok=True)
-    keys = [
-        "role", "employer_name", "location", "location_type", "position_type",
-        "minimum_salary", "industry", "job_spec_language", "tech_stack", "requirements", "job_link",
-    ]
-    with open(path, "w", encoding="utf-8", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=keys, extrasaction="ignore")
-        w.writeheader()
-        for ex in extracted_list:
-            row = {k: ex.get(k) for k in keys}
-            if isinstance(row.get("tech_stack"), list):
-                row["tech_stack"] = "; ".join(row["tech_stack"]) if row["tech_stack"] else ""
-            if isinstance(row.get("requirements"), list):
-                row["requirements"] = "; ".join(str(x)[:100] for x in row["requirements"]) if row["requirements"] else ""
-            w.writerow(row)
+    _ensure_dir(path)
+    with _open_export(path, "w", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(_CSV_COLUMNS)
+        w.writerows(map(_csv_row, extracted_list))
 
 
 def export_html(
@@ -143,8 +442,7 @@ def export_html(
 ) -> None:
     """Export job results as a self-contained HTML page viewable in a browser."""
 
-    def esc(value: object) -> str:
-        return _html_module.escape(str(value)) if value is not None else ""
+    esc = _esc_value
 
     def _normalised_keywords(prefs_obj: Any) -> list[str]:
         """
@@ -205,61 +503,46 @@ def export_html(
     # Normalised keywords from preferences (if any)
     norm_keywords = _normalised_keywords(prefs)
 
-    criteria_rows = f'<tr><th>Role</th><td>{esc(role) or "N/A"}</td></tr>'
-    criteria_rows += f'<tr><th>Location</th><td>{esc(location)}</td></tr>'
+    # Escaped once: the role appears in the page title, heading and criteria.
+    role_html = esc(role)
 
+    # (label, plain-text value) pairs, escaped together below.
+    criteria: list[tuple[str, object]] = [("Location", location)]
     if prefs:
-        criteria_rows += f'<tr><th>Date posted</th><td>{esc(prefs.date_posted)}</td></tr>'
+        criteria.append(("Date posted", prefs.date_posted))
         if prefs.europe_countries:
-            criteria_rows += (
-                f'<tr><th>Countries</th><td>{esc(", ".join(prefs.europe_countries).upper())}</td></tr>'
-            )
+            criteria.append(("Countries", ", ".join(prefs.europe_countries).upper()))
         if prefs.location_types:
-            criteria_rows += f'<tr><th>Location type</th><td>{esc(", ".join(prefs.location_types))}</td></tr>'
+            criteria.append(("Location type", ", ".join(prefs.location_types)))
         if prefs.position_types:
-            criteria_rows += f'<tr><th>Position type</th><td>{esc(", ".join(prefs.position_types))}</td></tr>'
+            criteria.append(("Position type", ", ".join(prefs.position_types)))
         if prefs.minimum_salary is not None:
-            criteria_rows += f'<tr><th>Min. salary</th><td>{prefs.minimum_salary:,} (annual)</td></tr>'
+            criteria.append(("Min. salary", f"{prefs.minimum_salary:,} (annual)"))
         if prefs.industry_filter:
-            criteria_rows += f'<tr><th>Industry</th><td>{esc(prefs.industry_filter)}</td></tr>'
+            criteria.append(("Industry", prefs.industry_filter))
         if prefs.language_filter and prefs.language_filter != "any":
-            criteria_rows += f'<tr><th>Job ad language</th><td>{esc(prefs.language_filter)}</td></tr>'
+            criteria.append(("Job ad language", prefs.language_filter))
         if norm_keywords:
-            criteria_rows += f'<tr><th>Keywords</th><td>{esc(", ".join(norm_keywords))}</td></tr>'
-
-    cards_html = ""
-    for i, ex in enumerate(extracted_list):
-        min_sal = ex.get("minimum_salary")
-        salary_row = (
-            f'<tr><th>Min. salary</th><td>{min_sal:,} (annual)</td></tr>'
-            if min_sal is not None
-            else ""
-        )
-
-        industry = ex.get("industry") or ""
-        industry_row = (
-            f'<tr><th>Industry</th><td>{esc(industry)}</td></tr>' if industry else ""
-        )
-
-        lang = ex.get("job_spec_language") or ""
-        lang_row = (
-            f'<tr><th>Job ad language</th><td>{esc(lang)}</td></tr>'
-            if lang and lang != "not defined"
-            else ""
-        )
-
-        tech = ex.get("tech_stack") or []
-        tech_tags = "".join(f'<span class="tag">{esc(t)}</span>' for t in tech)
-        tech_row = (
-            f'<tr><th>Tech stack</th><td class="tags">{tech_tags}</td></tr>'
-            if tech
-            else ""
+            criteria.append(("Keywords", ", ".join(norm_keywords)))
+
+    criteria_rows = f'<tr><th>Role</th><td>{role_html or "N/A"}</td></tr>' + "".join(
+        f"<tr><th>{label}</th><td>{esc(value)}</td></tr>" for label, value in criteria
+    )
+
+    def _card(number: int, ex: dict[str, Any]) -> str:
+        """Render the card for job #number (1-based)."""
+        # One line per optional row, left empty when the row is omitted.
+        optional_rows = "\n            ".join(
+            ""
+            if (cell := render(ex.get(key))) is None
+            else f"<tr><th>{label}</th><td{td_attrs}>{cell}</td></tr>"
+            for key, label, td_attrs, render in _OPTIONAL_ROWS
         )
 
         # Requirements with keyword highlighting
         reqs = ex.get("requirements") or []
         req_items = "".join(
-            f"<li>{_highlight_text(r[:200] + ('…' if len(r) > 200 else ''), norm_keywords)}</li>"
+            f"<li>{_highlight_text(_trunc(r, ellipsis='…'), norm_keywords)}</li>"
             for r in reqs[:8]
         )
         req_block = (
@@ -275,10 +558,10 @@ def export_html(
             else ""
         )
 
-        cards_html += f"""
+        return f"""
         <div class="card">
           <div class="card-header">
-            <span class="job-num">#{i + 1}</span>
+            <span class="job-num">#{number}</span>
             <div>
               <div class="job-title">{esc(ex.get("role", "N/A"))}</div>
               <div class="company">{esc(ex.get("employer_name", "N/A"))}</div>
@@ -288,10 +571,7 @@ def export_html(
             <tr><th>Location</th><td>{esc(ex.get("location") or "Not specified")}</td></tr>
             <tr><th>Location type</th><td>{esc(ex.get("location_type", "not defined"))}</td></tr>
             <tr><th>Position type</th><td>{esc(ex.get("position_type", "not defined"))}</td></tr>
-            {salary_row}
-            {industry_row}
-            {lang_row}
-            {tech_row}
+            {optional_rows}
           </table>
           {req_block}
           {apply_btn}
@@ -299,178 +579,60 @@ def export_html(
 """
 
     header_ts = esc(timestamp) if timestamp else ""
-    total = len(extracted_list)
-
-    html_page = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="utf-8" />
-  <meta name="viewport" content="width=device-width, initial-scale=1" />
-  <title>Job results — {esc(role)}</title>
-  <style>
-    *, *::before, *::after {{ box-sizing: border-box; margin: 0; padding: 0; }}
-    body {{
-      font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
-      background: #f4f6f9;
-      color: #222;
-      padding: 2rem 1rem;
-    }}
-    header {{
-      max-width: 860px;
-      margin: 0 auto 2rem;
-    }}
-    header h1 {{
-      font-size: 1.7rem;
-      font-weight: 700;
-      color: #1a1a2e;
-      margin-bottom: 1rem;
-    }}
-    .criteria {{
-      background: #fff;
-      border-radius: 10px;
-      box-shadow: 0 2px 8px rgba(0,0,0,.08);
-      padding: 1rem 1.4rem;
-      margin-bottom: 0.75rem;
-    }}
-    .criteria table {{
-      border-collapse: collapse;
-      font-size: 0.88rem;
-    }}
-    .criteria th {{
-      text-align: left;
-      width: 140px;
-      padding: 0.22rem 0.6rem 0.22rem 0;
-      color: #666;
-      font-weight: 600;
-    }}
-    .criteria td {{
-      color: #222;
-      padding: 0.22rem 0;
-    }}
-    .run-meta {{
-      font-size: 0.8rem;
-      color: #888;
-      margin-top: 0.5rem;
-    }}
-    .cards {{
-      max-width: 860px;
-      margin: 0 auto;
-      display: flex;
-      flex-direction: column;
-      gap: 1.25rem;
-    }}
-    .card {{
-      background: #fff;
-      border-radius: 10px;
-      box-shadow: 0 2px 8px rgba(0,0,0,.08);
-      padding: 1.4rem 1.6rem;
-    }}
-    .card-header {{
-      display: flex;
-      align-items: flex-start;
-      gap: 1rem;
-      margin-bottom: 1rem;
-    }}
-    .job-num {{
-      background: #e8edf5;
-      color: #3a5a8c;
-      font-weight: 700;
-      font-size: 0.8rem;
-      padding: 0.25rem 0.55rem;
-      border-radius: 6px;
-      white-space: nowrap;
-      margin-top: 0.2rem;
-    }}
-    .job-title {{
-      font-size: 1.15rem;
-      font-weight: 700;
-      color: #1a1a2e;
-    }}
-    .company {{
-      font-size: 0.95rem;
-      color: #555;
-      margin-top: 0.15rem;
-    }}
-    table.meta {{
-      border-collapse: collapse;
-      width: 100%;
-      font-size: 0.88rem;
-      margin-bottom: 0.9rem;
-    }}
-    table.meta th {{
-      text-align: left;
-      width: 140px;
-      padding: 0.28rem 0.5rem 0.28rem 0;
-      color: #666;
-      font-weight: 600;
-      vertical-align: top;
-    }}
-    table.meta td {{
-      padding: 0.28rem 0;
-      color: #333;
-      vertical-align: top;
-    }}
-    td.tags {{ display: flex; flex-wrap: wrap; gap: 0.35rem; }}
-    .tag {{
-      background: #e8f0fe;
-      color: #2a5aad;
-      font-size: 0.78rem;
-      padding: 0.18rem 0.55rem;
-      border-radius: 20px;
-      font-weight: 500;
-    }}
-    .reqs {{
-      font-size: 0.88rem;
-      margin-bottom: 1rem;
-    }}
-    .reqs strong {{
-      display: block;
-      margin-bottom: 0.4rem;
-      color: #444;
-    }}
-    .reqs ul {{
-      padding-left: 1.2rem;
-      color: #333;
-    }}
-    .reqs li {{ margin-bottom: 0.25rem; line-height: 1.45; }}
-    .apply-btn {{
-      display: inline-block;
-      background: #2a5aad;
-      color: #fff;
-      text-decoration: none;
-      padding: 0.45rem 1.1rem;
-      border-radius: 7px;
-      font-size: 0.88rem;
-      font-weight: 600;
-      transition: background 0.15s;
-    }}
-    .apply-btn:hover {{ background: #1e4080; }}
-    footer {{
-      max-width: 860px;
-      margin: 2rem auto 0;
-      font-size: 0.8rem;
-      color: #999;
-      text-align: center;
-    }}
-  </style>
-</head>
-<body>
-  <header>
-    <h1>Job results: {esc(role) or "N/A"}</h1>
-    <div class="criteria">
-      <table>
-        {criteria_rows}
-      </table>
-    </div>
-    <div class="run-meta">{total} job(s) after filtering{f" &nbsp;·&nbsp; Run: {header_ts}" if header_ts else ""}</div>
-  </header>
-  <div class="cards">
-    {cards_html}
-  </div>
-  <footer>Generated by Job Hunter Agent</footer>
-</body>
-</html>
-"""
+    run_meta = f"{len(extracted_list)} job(s) after filtering"
+    if header_ts:
+        run_meta += f" &nbsp;·&nbsp; Run: {header_ts}"
+
+    page_header = _PAGE_HEADER.substitute(
+        heading=role_html or "N/A",
+        criteria_rows=criteria_rows,
+        run_meta=run_meta,
+    )
+
+    # Cards are rendered and written one at a time through a large buffer, so
+    # the full page is never held in memory.
+    try:
+        _ensure_dir(path)
+        with _open_export(path, "w") as f:
+            f.write(_PAGE_OPEN.substitute(title=role_html))
+            f.write(_CSS)
+            f.write(page_header)
+            f.writelines(_card(number, ex) for number, ex in enumerate(extracted_list, 1))
+            f.write(_PAGE_TAIL)
+    finally:
+        # Only useful within one export; don't keep the escaped strings alive,
+        # even when the write fails.
+        _esc.cache_clear()
+        _tech_tags.cache_clear()
+
+
+def export_all(
+    extracted_list: list[dict[str, Any]],
+    prefs: Any = None,
+    timestamp: str = "",
+    *,
+    json_path: Path | None = None,
+    csv_path: Path | None = None,
+    html_path: Path | None = None,
+    json_compact: bool = True,
+) -> None:
+    """
+    Write the JSON, CSV and HTML exports whose path is given (None skips one).
+    json_compact is passed to export_json as compact.
 
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(html_page, encoding="utf-8")
+    The exporters are independent and I/O-bound, so they run concurrently on
+    a small thread pool; the first exporter error is re-raised.
+    """
+    exports = []
+    if json_path is not None:
+        exports.append(partial(export_json, extracted_list, json_path, prefs=prefs, compact=json_compact))
+    if csv_path is not None:
+        exports.append(partial(export_csv, extracted_list, csv_path))
+    if html_path is not None:
+        exports.append(partial(export_html, extracted_list, html_path, prefs=prefs, timestamp=timestamp))
+    if not exports:
+        return
+    with ThreadPoolExecutor(max_workers=len(exports)) as executor:
+        futures = [executor.submit(export) for export in exports]
+        for future in futures:
+            future.result()
@@ -0,0 +1,80 @@
+"""Tests for the file-based response cache."""
+
+import json
+
+import src.cache as cache
+
+
+def _write_entry(path, timestamp, etag=None):
+    path.write_text(
+        json.dumps(
+            {
+                "role": "Android Developer",
+                "location": "London",
+                "date_posted": "week",
+                "timestamp": timestamp,
+                "raw_response": {"status": "OK", "data": []},
+                "etag": etag,
+                "last_modified": None,
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+def test_save_cache_persists_validators_from_headers(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    cache.save_cache(
+        "Android Developer",
+        "London",
+        "week",
+        {"status": "OK", "data": []},
+        headers={"ETag": '"abc"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+    )
+
+    raw, etag, last_modified, stale = cache.load_cache_with_validators(
+        "Android Developer", "London", "week"
+    )
+    assert raw == {"status": "OK", "data": []}
+    assert etag == '"abc"'
+    assert last_modified == "Wed, 01 Jan 2025 00:00:00 GMT"
+    assert stale is False
+
+
+def test_expired_entry_is_returned_as_stale_with_validators(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    path = cache._key_to_path("Android Developer", "London", "week")
+    _write_entry(path, "2000-01-01T00:00:00+00:00", etag='"abc"')
+
+    assert cache.load_cache("Android Developer", "London", "week") is None
+    raw, etag, _last_modified, stale = cache.load_cache_with_validators(
+        "Android Developer", "London", "week"
+    )
+    assert raw == {"status": "OK", "data": []}
+    assert etag == '"abc"'
+    assert stale is True
+
+
+def test_touch_cache_refreshes_timestamp_only(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    path = cache._key_to_path("Android Developer", "London", "week")
+    _write_entry(path, "2000-01-01T00:00:00+00:00", etag='"abc"')
+
+    cache.touch_cache("Android Developer", "London", "week")
+
+    assert cache.load_cache("Android Developer", "London", "week") == {"status": "OK", "data": []}
+    _raw, etag, _last_modified, stale = cache.load_cache_with_validators(
+        "Android Developer", "London", "week"
+    )
+    assert etag == '"abc"'
+    assert stale is False
+
+
+def test_save_cache_stores_epoch_timestamp(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    cache.save_cache("Android Developer", "London", "week", {"status": "OK", "data": []})
+
+    path = cache._key_to_path("Android Developer", "London", "week")
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert isinstance(data["timestamp"], float)
+    assert cache.load_cache("Android Developer", "London", "week") == {"status": "OK", "data": []}
@@ -0,0 +1,115 @@
+"""Tests for mock response parsing, cache revalidation and country inference in the data source layer."""
+
+import ast
+import json
+
+import pytest
+
+import src.cache as cache
+import src.data_source as ds
+from src.config import SearchPreferences
+from src.data_source import _parse_mock_content
+
+
+def test_parse_mock_content_transcodes_python_literals():
+    content = (
+        "{'status': 'OK', 'data': [{'job_title': \"Dev's role\", 'employer_logo': None, "
+        "'job_is_remote': True, 'job_description': 'None of \"this\" is \\'quoted\\'',},],}"
+    )
+
+    expected = ast.literal_eval(content.replace(",}", "}").replace(",]", "]"))
+    assert _parse_mock_content(content) == expected
+
+
+def test_parse_mock_content_falls_back_to_literal_eval():
+    # \x escapes and tuples are valid Python literals but not JSON.
+    assert _parse_mock_content("{'a': '\\x41', 'b': (1, 2)}") == {"a": "A", "b": (1, 2)}
+
+
+def test_parse_mock_content_accepts_json():
+    assert _parse_mock_content('{"status": "OK", "data": [{"job_id": null}]}') == {
+        "status": "OK",
+        "data": [{"job_id": None}],
+    }
+
+
+class _FakeResponse:
+    def __init__(self, status_code, body=None, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._body = body
+
+    @property
+    def content(self):
+        return json.dumps(self._body).encode("utf-8")
+
+    def json(self):
+        return self._body
+
+    def raise_for_status(self):
+        pass
+
+
+def test_fetch_jobs_revalidates_stale_cache_with_conditional_get(tmp_path, monkeypatch):
+    monkeypatch.setenv("RAPID_API_KEY", "test-key")
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(ds, "DEBUG_DIR", tmp_path / "api-response")
+    monkeypatch.setattr(ds, "_debug_dir_ready", False)
+
+    body = {"status": "OK", "data": [{"job_id": "1", "job_title": "Android Developer"}]}
+    validators = {"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+    responses = [_FakeResponse(200, body, validators), _FakeResponse(304)]
+    sent_headers = []
+
+    def fake_get(url, params, headers, timeout):
+        sent_headers.append(dict(headers))
+        return responses.pop(0)
+
+    monkeypatch.setattr(ds._SESSION, "get", fake_get)
+    calls = []
+
+    def spy_save_cache(*args, **kwargs):
+        calls.append("save")
+        cache.save_cache(*args, **kwargs)
+
+    def spy_touch_cache(*args, **kwargs):
+        calls.append("touch")
+        cache.touch_cache(*args, **kwargs)
+
+    monkeypatch.setattr(ds, "save_cache", spy_save_cache)
+    monkeypatch.setattr(ds, "touch_cache", spy_touch_cache)
+    prefs = SearchPreferences("Android Developer", "London", "week", [], [], None, None, "en")
+
+    # No cache entry yet: a plain GET, whose body and validators are cached.
+    raw, _ts, used_cache, api_called = ds.fetch_jobs(prefs)
+    assert raw == body
+    assert (used_cache, api_called) == (False, True)
+    assert "If-None-Match" not in sent_headers[0]
+    assert "If-Modified-Since" not in sent_headers[0]
+    assert calls == ["save"]
+
+    # Expired entry: a conditional GET; on 304 the cached body is reused and
+    # only its timestamp is refreshed.
+    monkeypatch.setattr(cache, "_CACHE_TTL_SECS", -1)
+    raw, _ts, used_cache, api_called = ds.fetch_jobs(prefs)
+    assert raw == body
+    assert (used_cache, api_called) == (True, True)
+    assert sent_headers[1]["If-None-Match"] == '"v1"'
+    assert sent_headers[1]["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+    assert calls == ["save", "touch"]
+
+
+@pytest.mark.parametrize(
+    ("location", "expected"),
+    [
+        ("Ukraine", None),
+        ("Indiana", None),
+        ("Bangalore, İNDIA", None),
+        ("uſa", None),
+        ("LONDON, UK", "gb"),
+        ("Paris, France, UK", "fr"),
+        ("Berlin", "de"),
+    ],
+)
+def test_infer_country(location, expected):
+    assert ds._infer_country(location) == expected
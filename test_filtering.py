@@ -0,0 +1,44 @@
+"""Tests for the language pre-filter applied before extraction."""
+
+import pytest
+
+import src.extract as extract
+from src.extract import extract_all
+from src.filtering import pre_filter_by_language
+
+_EN = {"job_description": "We are looking for an Android developer to join our team and work with the latest tools."}
+_ES = {"job_description": "Buscamos un desarrollador Android con experiencia en Kotlin para nuestro equipo en Madrid."}
+_EMPTY = {"job_description": ""}
+
+
+def test_pre_filter_by_language_defaults_to_english():
+    assert pre_filter_by_language([_EN, _ES, _EMPTY], None) == ([_EN], ["en"])
+    assert pre_filter_by_language([_EN, _ES, _EMPTY], "EN") == ([_EN], ["en"])
+
+
+def test_pre_filter_by_language_any_keeps_all_jobs():
+    jobs = [_EN, _ES, _EMPTY]
+    kept, languages = pre_filter_by_language(jobs, "any")
+    assert kept is jobs
+    assert languages is None
+
+
+def test_pre_filter_by_language_other_code():
+    assert pre_filter_by_language([_EN, _ES], "es") == ([_ES], ["es"])
+
+
+def test_extract_all_reuses_pre_filter_languages(monkeypatch):
+    kept, languages = pre_filter_by_language([_EN, _ES, _EMPTY], "es")
+
+    def fail_detect(text):
+        raise AssertionError("language detected again")
+
+    monkeypatch.setattr(extract, "_detect_language", fail_detect)
+    extracted = extract_all(kept, languages)
+    assert [ex["job_spec_language"] for ex in extracted] == ["es"]
+    assert extracted[0]["_raw"] is _ES
+
+
+def test_extract_all_rejects_misaligned_languages():
+    with pytest.raises(ValueError):
+        extract_all([_EN, _ES], ["en"])
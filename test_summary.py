@@ -0,0 +1,25 @@
+"""Tests for the JSON export layout."""
+
+import json
+
+from src.summary import export_all
+
+_JOBS = [{"role": "Android Developer", "tech_stack": ["Kotlin"], "_raw": {"job_id": "1"}}]
+
+
+def test_export_all_writes_compact_json_by_default(tmp_path):
+    path = tmp_path / "jobs.json"
+    export_all(_JOBS, json_path=path)
+
+    text = path.read_text(encoding="utf-8")
+    assert "\n" not in text and ": " not in text
+    assert json.loads(text) == [{"role": "Android Developer", "tech_stack": ["Kotlin"]}]
+
+
+def test_export_all_indents_json_when_not_compact(tmp_path):
+    path = tmp_path / "jobs.json"
+    export_all(_JOBS, json_path=path, json_compact=False)
+
+    text = path.read_text(encoding="utf-8")
+    assert text.startswith('[\n  {\n    "role": "Android Developer"')
+    assert json.loads(text) == [{"role": "Android Developer", "tech_stack": ["Kotlin"]}]